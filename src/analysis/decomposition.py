@@ -9,6 +9,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 
 
@@ -34,6 +35,15 @@ class DecompositionResult:
     period_start: str
     period_end: str
     
+    @cached_property
+    def sorted_drivers(self) -> List[Tuple[str, float]]:
+        """Driver contributions ordered by absolute size, largest first."""
+        return sorted(
+            self.driver_contributions.items(),
+            key=lambda x: abs(x[1]),
+            reverse=True
+        )
+    
     def to_dataframe(self) -> pd.DataFrame:
         """Convert decomposition to DataFrame for easy viewing."""
         rows = []
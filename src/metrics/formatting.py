@@ -0,0 +1,43 @@
+"""
+Display formatting for metric values.
+
+Shared by the WBR memo, the KPI health grid and the executive dashboard.
+"""
+
+import pandas as pd
+
+
+def format_value_series(
+    values: pd.Series,
+    units: pd.Series,
+    days_suffix: bool = True
+) -> pd.Series:
+    """
+    Format a column of metric values based on their units.
+    
+    Each format is applied once to its whole unit group rather than row by
+    row, so whole tables can be formatted up front.
+    
+    Args:
+        values: Metric values
+        units: Unit for each value (aligned on the same index)
+        days_suffix: Render "days" values as "14.8 days"; when False they use
+            the generic two-decimal format (for tables with a Unit column)
+        
+    Returns:
+        Series of display strings with the same index as values
+    """
+    formatted = pd.Series("N/A", index=values.index, dtype=object)
+    present = values.notna()
+    
+    is_rate = present & units.eq("rate")
+    is_count = present & units.isin(["customers", "orders", "items"])
+    is_days = present & units.eq("days") & days_suffix
+    is_other = present & ~(is_rate | is_count | is_days)
+    
+    formatted[is_rate] = values[is_rate].map("{:.1%}".format)
+    formatted[is_count] = values[is_count].map("{:,.0f}".format)
+    formatted[is_days] = values[is_days].map("{:.1f} days".format)
+    formatted[is_other] = values[is_other].map("{:.2f}".format)
+    
+    return formatted
@@ -10,17 +10,20 @@ Production features:
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Tuple, Optional, Set
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 from pathlib import Path
 from datetime import datetime
 
 
-class CheckSeverity(Enum):
-    """Severity levels for quality check failures."""
-    INFO = "info"
-    WARNING = "warning"  # Warn but continue
-    ERROR = "error"  # Fail execution
+class CheckSeverity(IntEnum):
+    """Severity levels for quality check failures (ordered, so ``>=`` works)."""
+    INFO = 0
+    WARNING = 1  # Warn but continue
+    ERROR = 2  # Fail execution
 
 
 @dataclass
@@ -86,6 +89,13 @@ DATASET_CONTRACTS = {
 }
 
 
+# Row count at which validate_dataset runs its checks on _CHECK_POOL
+PARALLEL_CHECK_MIN_ROWS = 1_000_000
+
+# Shared by every checker; the checks only read df and return their own results
+_CHECK_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
+
 class DataQualityChecker:
     """
     Validates data quality with contracts and generates reports.
@@ -99,7 +109,8 @@ class DataQualityChecker:
         self, 
         df: pd.DataFrame, 
         dataset_name: str,
-        contract: Optional[DatasetContract] = None
+        contract: Optional[DatasetContract] = None,
+        arrow_backed: bool = False
     ) -> List[QualityCheckResult]:
         """
         Validate dataset against contract.
@@ -108,124 +119,207 @@ class DataQualityChecker:
             df: DataFrame to validate
             dataset_name: Name of dataset
             contract: Optional contract (uses default if available)
+            arrow_backed: Convert to pyarrow-backed dtypes before checking, so
+                null and min/max scans run on Arrow kernels and null bitmaps.
+                Frames read with ``dtype_backend='pyarrow'`` (e.g. via
+                ``pd.read_parquet`` or ``pd.read_csv``) skip the conversion copy.
             
         Returns:
             List of check results
         """
         self.results = []
         
+        if arrow_backed and not all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes):
+            df = df.convert_dtypes(dtype_backend='pyarrow')
+        
+        n_rows = len(df)
+        
         # Get contract
         if contract is None and dataset_name in DATASET_CONTRACTS:
             contract = DATASET_CONTRACTS[dataset_name]
         
+        checks = []
+        
         # Run contract checks
         if contract:
-            self._check_required_columns(df, contract)
-            self._check_min_row_count(df, contract)
-            self._check_null_rates(df, contract)
-            self._check_value_ranges(df, contract)
+            checks.append((self._check_required_columns, contract))
+            checks.append((self._check_min_row_count, contract, n_rows))
+            checks.append((self._check_null_rates, contract, n_rows))
+            checks.append((self._check_value_ranges, contract))
         
         # General checks
-        self._check_duplicates(df, dataset_name)
+        checks.append((self._check_duplicates, dataset_name))
+        
+        # Only large frames gain from overlapping the scans in threads; below
+        # the threshold the hand-off costs more than the checks themselves.
+        # Each task gets its own shallow copy, so no DataFrame object (or its
+        # column cache) is shared between threads; the data itself is not copied.
+        if n_rows >= PARALLEL_CHECK_MIN_ROWS:
+            tasks = [
+                _CHECK_POOL.submit(check, df.copy(deep=False), *args)
+                for check, *args in checks
+            ]
+            outputs = [task.result() for task in tasks]
+        else:
+            outputs = [check(df, *args) for check, *args in checks]
+        
+        # Collect in submission order so reports stay deterministic
+        for output in outputs:
+            self.results.extend(output)
         
         return self.results
     
-    def _check_required_columns(self, df: pd.DataFrame, contract: DatasetContract) -> None:
+    def optimize_dtypes(self, df: pd.DataFrame, contract: DatasetContract) -> pd.DataFrame:
+        """
+        Down-cast integer range columns to the smallest type holding their values.
+        
+        The casts cost a full scan and copy per column, more than a single
+        validation saves, so validate_dataset does not call this. Use it for
+        frames that are kept and scanned repeatedly. The caller's DataFrame
+        is left untouched.
+        
+        Args:
+            df: DataFrame to compact
+            contract: Contract whose expected_ranges columns are down-cast
+            
+        Returns:
+            Shallow copy with compact integer columns (df itself if none apply)
+        """
+        casts = {}
+        
+        for col in contract.expected_ranges or {}:
+            if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+                casts[col] = pd.to_numeric(df[col], downcast='integer')
+        
+        if not casts:
+            return df
+        
+        df = df.copy(deep=False)
+        for col, values in casts.items():
+            df[col] = values
+        
+        return df
+    
+    def _check_required_columns(self, df: pd.DataFrame, contract: DatasetContract) -> List[QualityCheckResult]:
         """Check required columns exist."""
-        missing_cols = contract.required_columns - set(df.columns)
+        # Index membership reuses pandas' cached column hash table
+        col_index = df.columns
+        missing_cols = [col for col in contract.required_columns if col not in col_index]
         
         if missing_cols:
-            self.results.append(QualityCheckResult(
+            return [QualityCheckResult(
                 check_name="required_columns",
                 passed=False,
                 severity=CheckSeverity.ERROR,
                 message=f"Missing required columns in {contract.name}",
-                details={"missing_columns": list(missing_cols)}
-            ))
-        else:
-            self.results.append(QualityCheckResult(
-                check_name="required_columns",
-                passed=True,
-                severity=CheckSeverity.INFO,
-                message=f"All required columns present in {contract.name}",
-                details={"column_count": len(df.columns)}
-            ))
+                details={"missing_columns": missing_cols}
+            )]
+        
+        return [QualityCheckResult(
+            check_name="required_columns",
+            passed=True,
+            severity=CheckSeverity.INFO,
+            message=f"All required columns present in {contract.name}",
+            details={"column_count": len(df.columns)}
+        )]
     
-    def _check_min_row_count(self, df: pd.DataFrame, contract: DatasetContract) -> None:
+    def _check_min_row_count(self, df: pd.DataFrame, contract: DatasetContract, n_rows: int) -> List[QualityCheckResult]:
         """Check minimum row count."""
-        row_count = len(df)
-        
-        if row_count < contract.min_row_count:
+        if n_rows < contract.min_row_count:
             # Warn if under threshold
-            self.results.append(QualityCheckResult(
+            return [QualityCheckResult(
                 check_name="min_row_count",
                 passed=False,
                 severity=CheckSeverity.WARNING,
-                message=f"{contract.name} has {row_count:,} rows, expected >={contract.min_row_count:,}",
-                details={"actual": row_count, "expected": contract.min_row_count}
-            ))
-        else:
-            self.results.append(QualityCheckResult(
-                check_name="min_row_count",
-                passed=True,
-                severity=CheckSeverity.INFO,
-                message=f"{contract.name} has {row_count:,} rows (✓)",
-                details={"row_count": row_count}
-            ))
+                message=f"{contract.name} has {n_rows:,} rows, expected >={contract.min_row_count:,}",
+                details={"actual": n_rows, "expected": contract.min_row_count}
+            )]
+        
+        return [QualityCheckResult(
+            check_name="min_row_count",
+            passed=True,
+            severity=CheckSeverity.INFO,
+            message=f"{contract.name} has {n_rows:,} rows (✓)",
+            details={"row_count": n_rows}
+        )]
     
-    def _check_null_rates(self, df: pd.DataFrame, contract: DatasetContract) -> None:
+    def _check_null_rates(self, df: pd.DataFrame, contract: DatasetContract, n_rows: int) -> List[QualityCheckResult]:
         """Check NULL rates per column."""
-        total_rows = len(df)
+        results = []
         
         for col in contract.required_columns:
             if col not in df.columns:
                 continue
             
-            null_count = df[col].isnull().sum()
-            null_rate = null_count / total_rows if total_rows > 0 else 0
+            # Zero-tolerance contracts only need to know whether any NULL exists
+            if contract.max_missing_rate == 0 and not df[col].isna().any():
+                continue
+            
+            null_count = df[col].isna().sum()
+            null_rate = null_count / n_rows if n_rows > 0 else 0
             
             if null_rate > contract.max_missing_rate:
-                self.results.append(QualityCheckResult(
+                results.append(QualityCheckResult(
                     check_name=f"null_rate_{col}",
                     passed=False,
                     severity=CheckSeverity.ERROR,
                     message=f"{col} has {null_rate:.1%} NULLs (max: {contract.max_missing_rate:.1%})",
                     details={"column": col, "null_rate": null_rate}
                 ))
+        
+        return results
     
-    def _check_value_ranges(self, df: pd.DataFrame, contract: DatasetContract) -> None:
+    def _check_value_ranges(self, df: pd.DataFrame, contract: DatasetContract) -> List[QualityCheckResult]:
         """Check value ranges."""
         if not contract.expected_ranges:
-            return
+            return []
         
-        for col, (min_val, max_val) in contract.expected_ranges.items():
-            if col not in df.columns:
-                continue
-            
+        # Bounds are read from the contract on every call, so edits to
+        # expected_ranges take effect immediately
+        present = [
+            (col, min_val, max_val)
+            for col, (min_val, max_val) in contract.expected_ranges.items()
+            if col in df.columns
+        ]
+        if not present:
+            return []
+        
+        results = []
+        for col, min_val, max_val in present:
             actual_min = df[col].min()
             actual_max = df[col].max()
             
+            if pd.isna(actual_min):  # Empty or all-NULL column
+                continue
+            
             if actual_min < min_val or actual_max > max_val:
-                self.results.append(QualityCheckResult(
+                results.append(QualityCheckResult(
                     check_name=f"range_{col}",
                     passed=False,
                     severity=CheckSeverity.WARNING,
                     message=f"{col} range [{actual_min:.2f}, {actual_max:.2f}] outside expected [{min_val}, {max_val}]",
                     details={"column": col, "actual_range": (actual_min, actual_max)}
                 ))
+        
+        return results
     
-    def _check_duplicates(self, df: pd.DataFrame, dataset_name: str) -> None:
+    def _check_duplicates(self, df: pd.DataFrame, dataset_name: str) -> List[QualityCheckResult]:
         """Check for duplicate rows."""
+        if df.columns.empty:
+            return []
+        
         dup_count = df.duplicated().sum()
         
-        if dup_count > 0:
-            self.results.append(QualityCheckResult(
-                check_name="duplicates",
-                passed=False,
-                severity=CheckSeverity.WARNING,
-                message=f"Found {dup_count:,} duplicate rows in {dataset_name}",
-                details={"duplicate_count": dup_count}
-            ))
+        if dup_count == 0:
+            return []
+        
+        return [QualityCheckResult(
+            check_name="duplicates",
+            passed=False,
+            severity=CheckSeverity.WARNING,
+            message=f"Found {dup_count:,} duplicate rows in {dataset_name}",
+            details={"duplicate_count": dup_count}
+        )]
     
     def generate_report(self, output_path: Path) -> None:
         """
@@ -239,21 +333,25 @@ class DataQualityChecker:
         lines.append(f"\n**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         lines.append(f"\n**Total Checks:** {len(self.results)}")
         
+        # Classify results in a single pass
+        buckets = defaultdict(list)
+        for r in self.results:
+            buckets[(r.severity, r.passed)].append(r)
+        
+        errors_list = buckets[(CheckSeverity.ERROR, False)]
+        warnings_list = buckets[(CheckSeverity.WARNING, False)]
+        info_list = buckets[(CheckSeverity.INFO, True)]
+        
         # Summary stats
-        passed = sum(1 for r in self.results if r.passed)
-        errors = sum(1 for r in self.results if r.severity == CheckSeverity.ERROR and not r.passed)
-        warnings = sum(1 for r in self.results if r.severity == CheckSeverity.WARNING and not r.passed)
+        passed = sum(len(bucket) for (_, ok), bucket in buckets.items() if ok)
+        errors = len(errors_list)
+        warnings = len(warnings_list)
         
         lines.append(f"\n## Summary\n")
         lines.append(f"- ✅ **Passed:** {passed}")
         lines.append(f"- ❌ **Errors:** {errors}")
         lines.append(f"- ⚠️  **Warnings:** {warnings}")
         
-        # Group by severity
-        errors_list = [r for r in self.results if r.severity == CheckSeverity.ERROR and not r.passed]
-        warnings_list = [r for r in self.results if r.severity == CheckSeverity.WARNING and not r.passed]
-        info_list = [r for r in self.results if r.passed and r.severity == CheckSeverity.INFO]
-        
         # Errors section
         if errors_list:
             lines.append(f"\n## ❌ Errors (Fail)")
@@ -296,7 +394,7 @@ class DataQualityChecker:
         
         # Write report
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
+        with open(output_path, 'w', buffering=1 << 20) as f:
             f.write('\n'.join(lines))
         
         print(f"✓ Quality report saved: {output_path}")
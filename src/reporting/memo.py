@@ -8,6 +8,8 @@ Creates executive-ready WBR with:
 - Risks and guardrails
 """
 
+import io
+
 import pandas as pd
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -15,6 +17,45 @@ from pathlib import Path
 
 from ..config import REPORTS_DIR
 from ..analysis.decomposition import DecompositionResult
+from ..metrics.formatting import format_value_series
+
+
+# Status markers for the key-metrics table and the guardrail list
+_STATUS_ICON = {"OK": "✅", "WARNING": "⚠️", "CRITICAL": "❌"}
+_GUARD_ICON = {"CRITICAL": "🔴", "WARNING": "🟡"}
+
+
+def partition_metrics(metrics_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Split metrics into one DataFrame per metric_type.
+    
+    For batch memo generation (e.g. a historical backfill), partition once
+    and pass the 'guardrail' slice to each create_weekly_business_review
+    call as guardrails_df, instead of rescanning metric_type every time.
+    
+    Args:
+        metrics_df: Metrics DataFrame with a metric_type column
+        
+    Returns:
+        Dict mapping metric type to its rows
+    """
+    return dict(tuple(metrics_df.groupby('metric_type', sort=False)))
+
+
+def _prepare_memo_frame(metrics_df: pd.DataFrame) -> pd.DataFrame:
+    """Fill optional memo columns with defaults and add display_value."""
+    index = metrics_df.index
+    owner_role = metrics_df.get('owner_role', pd.Series(None, index=index, dtype=object))
+    prepared = metrics_df.assign(
+        unit=metrics_df.get('unit', pd.Series('', index=index)).fillna(''),
+        status=metrics_df.get('status', pd.Series('OK', index=index)).fillna('OK'),
+        # The metrics table shows a missing owner as N/A; actions assign it to the team
+        owner_role=owner_role.fillna('N/A'),
+        action_owner=owner_role.fillna('team'),
+    )
+    return prepared.assign(
+        display_value=format_value_series(prepared['value'], prepared['unit'])
+    )
 
 
 class KPIReportBuilder:
@@ -45,7 +86,8 @@ class KPIReportBuilder:
         north_star_info: Dict,
         decomposition: Optional[DecompositionResult] = None,
         key_insights: Optional[List[str]] = None,
-        save: bool = True
+        save: bool = True,
+        guardrails_df: Optional[pd.DataFrame] = None
     ) -> str:
         """
         Create a weekly business review memo.
@@ -56,156 +98,174 @@ class KPIReportBuilder:
             decomposition: Optional decomposition result
             key_insights: Optional list of key insights
             save: Whether to save to file
+            guardrails_df: Optional pre-split guardrail rows (see
+                partition_metrics); scanned from metrics_df when omitted
             
         Returns:
             Markdown-formatted report string
         """
-        lines = []
+        # Fill optional columns and format every value once, so the row
+        # loops below need no defaults and all sections read display_value
+        metrics_df = _prepare_memo_frame(metrics_df)
+        
+        # Status masks, computed once and shared by every section
+        warn_mask = metrics_df['status'].eq('WARNING')
+        crit_mask = metrics_df['status'].eq('CRITICAL')
+        
+        # Guardrail rows: use the pre-split slice if given, else scan metric_type
+        if guardrails_df is not None:
+            guardrails = _prepare_memo_frame(guardrails_df)
+        elif 'metric_type' in metrics_df.columns:
+            guardrails = metrics_df.loc[metrics_df['metric_type'].eq('guardrail')]
+        else:
+            guardrails = pd.DataFrame()
+        
+        buf = io.StringIO()
+        write = buf.write
+        now = datetime.now()  # One timestamp for header and footer
         
         # Header
-        lines.append("# Weekly Business Review")
-        lines.append(f"\n**Date:** {datetime.now().strftime('%B %d, %Y')}")
-        lines.append(f"**Period:** Current Week")
-        lines.append("\n---\n")
+        write("# Weekly Business Review\n")
+        write(f"\n**Date:** {now.strftime('%B %d, %Y')}\n")
+        write(f"**Period:** Current Week\n")
+        write("\n---\n\n")
         
         # Section 1: What Changed
-        lines.append("## 📊 What Changed")
-        lines.append("\n### North Star Metric")
-        lines.append(f"**VPAC (Value per Active Customer):** {north_star_info['value']:.2f} items/customer")
+        write("## 📊 What Changed\n")
+        write("\n### North Star Metric\n")
+        write(f"**VPAC (Value per Active Customer):** {north_star_info['value']:.2f} items/customer\n")
         
         # Add components with numbers
-        lines.append("\n**Formula:** Orders/Customer × Items/Order")
+        write("\n**Formula:** Orders/Customer × Items/Order\n")
         for comp_key, comp_val in north_star_info['components'].items():
             comp_name = comp_key.replace('_', ' ').title()
-            lines.append(f"- {comp_name}: {comp_val:.2f}")
+            write(f"- {comp_name}: {comp_val:.2f}\n")
         
         # Key metrics table
-        lines.append("\n### Key Metrics")
-        lines.append("\n| Metric | Value | Owner | Status |")
-        lines.append("|--------|-------|-------|--------|")
-        
-        for _, row in metrics_df.head(10).iterrows():
-            value_str = self._format_metric_value(row['value'], row.get('unit', ''))
-            status = row.get('status', 'OK')
-            status_icon = "✅" if status == "OK" else ("⚠️" if status == "WARNING" else "❌")
-            lines.append(
-                f"| {row['display_name']} | **{value_str}** | "
-                f"{row.get('owner_role', 'N/A')} | {status_icon} {status} |"
+        write("\n### Key Metrics\n")
+        write("\n| Metric | Value | Owner | Status |\n")
+        write("|--------|-------|-------|--------|\n")
+        
+        top = metrics_df.head(10)
+        status_icons = top['status'].map(_STATUS_ICON).fillna("❌")
+        
+        row_fmt = "| {} | **{}** | {} | {} {} |\n".format
+        write("".join([
+            row_fmt(display_name, value_str, owner, status_icon, status)
+            for display_name, value_str, owner, status_icon, status in zip(
+                top['display_name'], top['display_value'], top['owner_role'],
+                status_icons, top['status']
             )
+        ]))
         
-        lines.append("\n")
+        write("\n\n")
         
         # Section 2: Why It Changed
-        lines.append("## 🔍 Why It Changed")
+        write("## 🔍 Why It Changed\n")
         
         if decomposition:
-            lines.append(f"\n**Total Change:** {decomposition.total_change:+.2f} ({decomposition.percent_change:+.1%})")
-            lines.append("\n### Driver Attribution")
+            write(f"\n**Total Change:** {decomposition.total_change:+.2f} ({decomposition.percent_change:+.1%})\n")
+            write("\n### Driver Attribution\n")
             
-            # Sort drivers by absolute contribution
-            sorted_drivers = sorted(
-                decomposition.driver_contributions.items(),
-                key=lambda x: abs(x[1]),
-                reverse=True
-            )
+            # Percent-of-change scale, 0 when there was no change to attribute
+            total_change = decomposition.total_change
+            pct_scale = 100.0 / total_change if total_change != 0 else 0.0
+            
+            # Drivers by absolute contribution (sorted once, shared with actions),
+            # skipping a negligible interaction term
+            shown_drivers = [
+                (driver, contrib) for driver, contrib in decomposition.sorted_drivers
+                if not (driver == 'interaction' and abs(contrib) < 0.01)
+            ]
             
-            for driver, contrib in sorted_drivers:
-                if driver == 'interaction' and abs(contrib) < 0.01:
-                    continue
-                
-                driver_name = driver.replace('_', ' ').title()
-                pct_of_total = (contrib / decomposition.total_change * 100) if decomposition.total_change != 0 else 0
-                
-                # Add arrow and explanation
-                arrow = "↑" if contrib > 0 else "↓"
-                lines.append(f"- **{driver_name}** {arrow} contributed **{contrib:+.2f}** ({pct_of_total:+.0f}% of change)")
+            # Arrow, contribution and share of total change per driver
+            # (+ 0.0 keeps a zero scale from printing "-0")
+            write("".join([
+                f"- **{driver.replace('_', ' ').title()}** {'↑' if contrib > 0 else '↓'} "
+                f"contributed **{contrib:+.2f}** ({contrib * pct_scale + 0.0:+.0f}% of change)\n"
+                for driver, contrib in shown_drivers
+            ]))
         else:
-            lines.append("\n*Decomposition analysis not available - configure period comparison to enable.*")
+            write("\n*Decomposition analysis not available - configure period comparison to enable.*\n")
         
-        lines.append("\n")
+        write("\n\n")
         
         # Section 3: What We Should Do Next
-        lines.append("## 🎯 What We Should Do Next")
-        lines.append("\n### Recommended Actions")
+        write("## 🎯 What We Should Do Next\n")
+        write("\n### Recommended Actions\n")
         
         # Generate actions based on metrics
-        actions = self._generate_actions(metrics_df, decomposition)
+        actions = self._generate_actions(
+            metrics_df, decomposition, warn_mask=warn_mask, crit_mask=crit_mask
+        )
         for i, action in enumerate(actions, 1):
-            lines.append(f"{i}. {action}")
+            write(f"{i}. {action}\n")
         
-        lines.append("\n")
+        write("\n\n")
         
         # Section 4: Risks / Guardrails
-        lines.append("## ⚠️ Risks & Guardrails")
+        write("## ⚠️ Risks & Guardrails\n")
         
         # Check guardrail metrics
-        guardrails = metrics_df[metrics_df['metric_type'] == 'guardrail'] if 'metric_type' in metrics_df.columns else pd.DataFrame()
-        
         if len(guardrails) > 0:
-            lines.append("\n### Guardrail Status")
-            for _, row in guardrails.iterrows():
-                status = row.get('status', 'OK')
-                value_str = self._format_metric_value(row['value'], row.get('unit', ''))
-                
-                if status != "OK":
-                    icon = "🔴" if status == "CRITICAL" else "🟡"
-                    lines.append(f"- {icon} **{row['display_name']}**: {value_str} - {status}")
-                else:
-                    lines.append(f"- ✅ **{row['display_name']}**: {value_str} - Within bounds")
+            write("\n### Guardrail Status\n")
+            is_ok = guardrails['status'].eq("OK")
+            icons = guardrails['status'].map(_GUARD_ICON).fillna("🟡").mask(is_ok, "✅")
+            notes = guardrails['status'].mask(is_ok, "Within bounds")
+            write("".join([
+                f"- {icon} **{display_name}**: {value_str} - {note}\n"
+                for icon, display_name, value_str, note in zip(
+                    icons, guardrails['display_name'], guardrails['display_value'], notes
+                )
+            ]))
         
         # Additional risks
-        lines.append("\n### Key Risks to Monitor")
-        lines.append("- **Data Quality:** Ensure base tables refresh on schedule")
-        lines.append("- **Seasonal Effects:** Consider day-of-week and time-of-day patterns")
-        lines.append("- **Segment Shifts:** Monitor power user vs regular customer balance")
+        write("\n### Key Risks to Monitor\n")
+        write("- **Data Quality:** Ensure base tables refresh on schedule\n")
+        write("- **Seasonal Effects:** Consider day-of-week and time-of-day patterns\n")
+        write("- **Segment Shifts:** Monitor power user vs regular customer balance\n")
         
-        lines.append("\n")
+        write("\n\n")
         
         # Insights section (if provided)
         if key_insights:
-            lines.append("## 💡 Key Insights")
+            write("## 💡 Key Insights\n")
             for insight in key_insights:
-                lines.append(f"- {insight}")
-            lines.append("\n")
+                write(f"- {insight}\n")
+            write("\n\n")
         
         # Footer
-        lines.append("---")
-        lines.append(f"\n*Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-        lines.append("\n*All metrics link to definitions in `docs/metric_dictionary.md`*")
+        write("---\n")
+        write(f"\n*Report generated: {now.strftime('%Y-%m-%d %H:%M:%S')}*\n")
+        write("\n*All metrics link to definitions in `docs/metric_dictionary.md`*")
         
-        report = "\n".join(lines)
+        report = buf.getvalue()
         
         # Save to file
         if save:
             output_path = self.output_dir / "wbr.md"
-            with open(output_path, 'w') as f:
-                f.write(report)
+            output_path.write_text(report, encoding='utf-8')
             print(f"✓ Saved: {output_path}")
         
         return report
     
-    def _format_metric_value(self, value: float, unit: str) -> str:
-        """Format metric value based on unit."""
-        if pd.isna(value):
-            return "N/A"
-        
-        if unit == "rate":
-            return f"{value:.1%}"
-        elif unit in ["customers", "orders", "items"]:
-            return f"{value:,.0f}"
-        elif unit == "days":
-            return f"{value:.1f} days"
-        else:
-            return f"{value:.2f}"
-    
     def _generate_actions(
         self, 
         metrics_df: pd.DataFrame, 
-        decomposition: Optional[DecompositionResult]
+        decomposition: Optional[DecompositionResult],
+        warn_mask: Optional[pd.Series] = None,
+        crit_mask: Optional[pd.Series] = None
     ) -> List[str]:
         """
         Generate recommended actions based on metrics.
         
+        Args:
+            metrics_df: Metrics prepared by _prepare_memo_frame (display_value,
+                action_owner)
+            decomposition: Optional decomposition result
+            warn_mask: Optional precomputed status == 'WARNING' mask
+            crit_mask: Optional precomputed status == 'CRITICAL' mask
+        
         Returns:
             List of action items with metric references
         """
@@ -213,32 +273,31 @@ class KPIReportBuilder:
         
         # Check for metric issues
         if 'status' in metrics_df.columns:
-            warnings = metrics_df[metrics_df['status'] == 'WARNING']
-            errors = metrics_df[metrics_df['status'] == 'CRITICAL']
+            if warn_mask is None:
+                warn_mask = metrics_df['status'].eq('WARNING')
+            if crit_mask is None:
+                crit_mask = metrics_df['status'].eq('CRITICAL')
+            warnings = metrics_df.loc[warn_mask]
+            errors = metrics_df.loc[crit_mask]
             
             if len(errors) > 0:
-                for _, row in errors.head(2).iterrows():
+                for row in errors.head(2).itertuples(index=False):
                     actions.append(
-                        f"**URGENT:** Address {row['display_name']} "
-                        f"({self._format_metric_value(row['value'], row.get('unit', ''))}) - "
-                        f"assigned to {row.get('owner_role', 'team')}"
+                        f"**URGENT:** Address {row.display_name} "
+                        f"({row.display_value}) - "
+                        f"assigned to {getattr(row, 'action_owner', 'team')}"
                     )
             
             if len(warnings) > 0:
-                for _, row in warnings.head(2).iterrows():
+                for row in warnings.head(2).itertuples(index=False):
                     actions.append(
-                        f"Investigate {row['display_name']} trend - "
-                        f"currently at {self._format_metric_value(row['value'], row.get('unit', ''))}"
+                        f"Investigate {row.display_name} trend - "
+                        f"currently at {row.display_value}"
                     )
         
         # Decomposition-based actions
         if decomposition:
-            sorted_drivers = sorted(
-                decomposition.driver_contributions.items(),
-                key=lambda x: abs(x[1]),
-                reverse=True
-            )
-            
+            sorted_drivers = decomposition.sorted_drivers
             top_driver = sorted_drivers[0][0] if sorted_drivers else None
             
             if top_driver == 'orders_per_customer':
@@ -272,8 +331,8 @@ class KPIReportBuilder:
         Returns:
             Formatted table
         """
-        # Select and rename columns
-        table = metrics_df[['display_name', 'value', 'unit', 'owner', 'metric_type']].copy()
+        # Select and rename columns (list selection already returns a new frame)
+        table = metrics_df[['display_name', 'value', 'unit', 'owner', 'metric_type']]
         table.columns = ['Metric', 'Value', 'Unit', 'Owner', 'Type']
         
         return table
@@ -7,12 +7,15 @@ Uses matplotlib and seaborn for consistency and clarity.
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+import matplotlib.colors as mcolors
+from matplotlib.collections import LineCollection
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch
 import seaborn as sns
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+from functools import lru_cache
 
 from ..config import (
     COLOR_POSITIVE,
@@ -32,12 +35,38 @@ from ..config import (
     FIGURES_DIR,
 )
 from ..analysis.decomposition import DecompositionResult
+from ..metrics.formatting import format_value_series
 
 
-# Set global style
-sns.set_style("whitegrid")
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica', 'DejaVu Sans']
+@lru_cache(maxsize=1)
+def _apply_style() -> None:
+    """Set the global plot style once, on first use rather than at import."""
+    sns.set_style("whitegrid")
+    plt.rcParams['font.family'] = 'sans-serif'
+    plt.rcParams['font.sans-serif'] = ['Arial', 'Helvetica', 'DejaVu Sans']
+
+
+def _save_figure(
+    fig: plt.Figure,
+    save_path: Path,
+    dpi: int = 150,
+    compress_level: int = 1,
+    tight: bool = True
+) -> None:
+    """
+    Save a figure in the format implied by its file extension.
+    
+    PNGs default to 150 dpi and fast (level 1) compression; vector formats
+    such as svg skip rasterization entirely and ignore both settings.
+    Pass tight=False for figures with explicit margins, which skips the
+    extra draw that bbox_inches='tight' needs to measure the content.
+    """
+    bbox_inches = 'tight' if tight else None
+    if save_path.suffix == '.png':
+        fig.savefig(save_path, dpi=dpi, bbox_inches=bbox_inches, facecolor='white',
+                    pil_kwargs={'compress_level': compress_level})
+    else:
+        fig.savefig(save_path, bbox_inches=bbox_inches, facecolor='white')
 
 
 class KPIVisualizer:
@@ -50,17 +79,50 @@ class KPIVisualizer:
     3. Funnel-to-Value Bridge (placeholder - requires event data)
     4. KPI Health Grid
     5. Anomaly Calendar (placeholder - requires time series)
+    
+    Set OUTPUT_FORMAT to 'svg' (on the class or an instance) to save vector
+    figures instead of PNGs.
     """
     
-    def __init__(self, output_dir: Optional[Path] = None):
+    OUTPUT_FORMAT = 'png'
+    
+    def __init__(self, output_dir: Optional[Path] = None, reuse_fig: bool = False):
         """
         Initialize visualizer.
         
         Args:
             output_dir: Directory to save figures (defaults to FIGURES_DIR from config)
+            reuse_fig: Clear and reuse one Figure per figsize across plot calls
+                instead of allocating a new one each time. A returned figure is
+                only valid until the next plot with the same figsize.
         """
+        _apply_style()
         self.output_dir = output_dir or FIGURES_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.reuse_fig = reuse_fig
+        self._fig_cache: Dict[Tuple[float, float], plt.Figure] = {}
+    
+    def _new_figure(self, figsize: Tuple[float, float], nrows: int = 1, ncols: int = 1):
+        """
+        Create a figure with a grid of axes, reusing a pooled figure if enabled.
+        
+        Returns:
+            (figure, axes) like plt.subplots
+        """
+        if not self.reuse_fig:
+            return plt.subplots(nrows, ncols, figsize=figsize)
+        
+        figsize = tuple(figsize)
+        fig = self._fig_cache.get(figsize)
+        if fig is None:
+            fig = plt.figure(figsize=figsize)
+            self._fig_cache[figsize] = fig
+        else:
+            fig.clear()
+            # Undo the previous plot's tight_layout so layout starts from rc defaults
+            fig.subplots_adjust(**{k: plt.rcParams[f'figure.subplot.{k}']
+                                   for k in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')})
+        return fig, fig.subplots(nrows, ncols)
         
     def plot_metric_tree(
         self,
@@ -81,7 +143,7 @@ class KPIVisualizer:
         Returns:
             Figure object
         """
-        fig, ax = plt.subplots(figsize=FIGSIZE_WIDE)
+        fig, ax = self._new_figure(FIGSIZE_WIDE)
         ax.axis('off')
         ax.set_xlim(0, 10)
         ax.set_ylim(0, 10)
@@ -171,11 +233,11 @@ class KPIVisualizer:
         fig.suptitle("KPI Metric Tree: North Star & Drivers", 
                      fontsize=TITLE_FONTSIZE + 2, fontweight='bold', y=0.98)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
-            save_path = self.output_dir / "01_metric_tree.png"
-            fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
+            save_path = self.output_dir / f"01_metric_tree.{self.OUTPUT_FORMAT}"
+            _save_figure(fig, save_path)
             print(f"✓ Saved: {save_path}")
         
         return fig
@@ -195,7 +257,7 @@ class KPIVisualizer:
         Returns:
             Figure object
         """
-        fig, ax = plt.subplots(figsize=FIGSIZE_STANDARD)
+        fig, ax = self._new_figure(FIGSIZE_STANDARD)
         
         # Prepare data
         drivers = []
@@ -221,48 +283,42 @@ class KPIVisualizer:
         n = len(drivers)
         x_pos = np.arange(n)
         
+        contribs = np.asarray(contributions, dtype=np.float64)
+        
         # Calculate cumulative for bar positioning
         # For waterfall: start bottom of bar at cumulative of previous
-        bottoms = [0]
-        cumulative = 0
-        for i, val in enumerate(contributions[:-1]):  # Exclude total
-            cumulative += val
-            bottoms.append(cumulative - contributions[i+1] if i < len(contributions)-2 else 0)
+        bottoms = np.empty(n)
+        bottoms[0] = 0.0
+        bottoms[1:] = np.cumsum(contribs)[:-1] - contribs[1:]
+        bottoms[-1] = 0.0  # Total starts at zero
         
         # Colors: positive = green, negative = red, total = blue
-        colors = []
-        for i, val in enumerate(contributions):
-            if i == len(contributions) - 1:  # Total
-                colors.append(COLOR_PRIMARY)
-            elif val >= 0:
-                colors.append(COLOR_POSITIVE)
-            else:
-                colors.append(COLOR_NEGATIVE)
-        
-        # Plot bars
-        bars = ax.bar(x_pos[:-1], contributions[:-1], bottom=bottoms[:-1],
-                      color=colors[:-1], edgecolor='black', linewidth=1, alpha=0.7)
-        
-        # Total bar
-        ax.bar(x_pos[-1], contributions[-1], bottom=0,
-               color=colors[-1], edgecolor='black', linewidth=2, alpha=0.8)
-        
-        # Add value labels
-        for i, (driver, contrib) in enumerate(zip(drivers, contributions)):
-            if i < len(contributions) - 1:
-                y_pos = bottoms[i] + contrib/2
-            else:
-                y_pos = contrib/2
-            
-            ax.text(i, y_pos, f"{contrib:+.2f}",
+        colors = np.where(contribs >= 0, COLOR_POSITIVE, COLOR_NEGATIVE).astype(object)
+        colors[-1] = COLOR_PRIMARY
+        
+        # Plot all bars in one call; the total bar is more opaque and outlined heavier
+        is_total = x_pos == n - 1
+        alphas = np.where(is_total, 0.8, 0.7)
+        ax.bar(x_pos, contribs, bottom=bottoms,
+               color=mcolors.to_rgba_array(list(colors), alpha=alphas),
+               edgecolor=mcolors.to_rgba_array(['black'] * n, alpha=alphas),
+               linewidth=np.where(is_total, 2, 1))
+        
+        # Add value labels at bar centers (white on large bars, black on small ones)
+        label_y = bottoms + contribs / 2
+        label_colors = np.where(np.abs(contribs) > 0.5, 'white', 'black')
+        for x, y, contrib, color in zip(x_pos, label_y, contribs, label_colors):
+            ax.text(x, y, f"{contrib:+.2f}",
                     ha='center', va='center', fontsize=TICK_FONTSIZE,
-                    fontweight='bold', color='white' if abs(contrib) > 0.5 else 'black')
+                    fontweight='bold', color=color)
         
-        # Connecting lines (optional, for clarity)
-        for i in range(len(x_pos) - 2):
-            ax.plot([x_pos[i] + 0.4, x_pos[i+1] - 0.4],
-                    [bottoms[i] + contributions[i], bottoms[i+1]],
-                    'k--', linewidth=0.8, alpha=0.5)
+        # Connecting lines (optional, for clarity), drawn as one collection
+        starts = np.column_stack([x_pos[:-2] + 0.4, bottoms[:-2] + contribs[:-2]])
+        ends = np.column_stack([x_pos[1:-1] - 0.4, bottoms[1:-1]])
+        ax.add_collection(LineCollection(
+            np.stack([starts, ends], axis=1),
+            colors='k', linestyles='--', linewidths=0.8, alpha=0.5, zorder=2
+        ))
         
         # Formatting
         ax.set_xticks(x_pos)
@@ -278,11 +334,11 @@ class KPIVisualizer:
         # Zero line
         ax.axhline(y=0, color='black', linewidth=1.5, linestyle='-', alpha=0.8)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
-            save_path = self.output_dir / "02_vpac_waterfall.png"
-            fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
+            save_path = self.output_dir / f"02_vpac_waterfall.{self.OUTPUT_FORMAT}"
+            _save_figure(fig, save_path)
             print(f"✓ Saved: {save_path}")
         
         return fig
@@ -302,35 +358,37 @@ class KPIVisualizer:
         Returns:
             Figure object
         """
-        fig, ax = plt.subplots(figsize=(12, len(metrics_df) * 0.5 + 1))
+        fig, ax = self._new_figure((12, len(metrics_df) * 0.5 + 1))
         ax.axis('tight')
         ax.axis('off')
         
-        # Prepare table data
-        table_data = []
-        for _, row in metrics_df.iterrows():
-            display_name = row['display_name']
-            value = row['value']
-            unit = row['unit']
-            
-            # Format value
-            if unit == 'rate':
-                value_str = f"{value:.1%}"
-            elif unit in ['customers', 'orders', 'items']:
-                value_str = f"{value:,.0f}"
-            else:
-                value_str = f"{value:.2f}"
-            
+        # Prepare table data column by column (the Unit column already shows "days")
+        grid = metrics_df[['display_name', 'unit']].assign(
+            value_str=format_value_series(metrics_df['value'], metrics_df['unit'], days_suffix=False),
             # Status based on threshold validation
-            metric_name = row['metric_name']
-            status = self._get_metric_status(metric_name, value, unit)
-            
-            table_data.append([display_name, value_str, unit, status])
+            status=[
+                self._get_metric_status(name, value, unit)
+                for name, value, unit in zip(
+                    metrics_df['metric_name'], metrics_df['value'], metrics_df['unit']
+                )
+            ],
+        )
+        table_data = grid[['display_name', 'value_str', 'unit', 'status']].values.tolist()
+        
+        # Cell colors: alternating row shading, status column tinted by status
+        statuses = grid['status'].to_numpy()
+        cell_colours = np.empty((len(table_data), 4), dtype=object)
+        cell_colours[0::2] = 'white'
+        cell_colours[1::2] = '#f0f0f0'
+        cell_colours[statuses == "OK", 3] = '#d4edda'  # Light green
+        cell_colours[statuses == "WARNING", 3] = '#f8d7da'  # Light red
         
         # Create table
         table = ax.table(
             cellText=table_data,
+            cellColours=cell_colours,
             colLabels=['Metric', 'Value', 'Unit', 'Status'],
+            colColours=[COLOR_PRIMARY] * 4,
             cellLoc='left',
             loc='center',
             colWidths=[0.4, 0.25, 0.2, 0.15]
@@ -341,44 +399,23 @@ class KPIVisualizer:
         table.set_fontsize(TICK_FONTSIZE)
         table.scale(1, 2)
         
-        # Header styling
+        # Header text styling
         for i in range(4):
-            cell = table[(0, i)]
-            cell.set_facecolor(COLOR_PRIMARY)
-            cell.set_text_props(weight='bold', color='white', fontsize=LABEL_FONTSIZE)
-        
-        # Alternating row colors and status coloring
-        for i in range(1, len(table_data) + 1):
-            for j in range(4):
-                cell = table[(i, j)]
-                
-                # Base row color
-                if i % 2 == 0:
-                    base_color = '#f0f0f0'
-                else:
-                    base_color = 'white'
-                
-                # Status column gets special coloring
-                if j == 3:  # Status column
-                    status_text = table_data[i-1][3]
-                    if status_text == "OK":
-                        cell.set_facecolor('#d4edda')  # Light green
-                        cell.set_text_props(weight='bold', color='#155724')
-                    elif status_text == "WARNING":
-                        cell.set_facecolor('#f8d7da')  # Light red
-                        cell.set_text_props(weight='bold', color='#721c24')
-                    else:
-                        cell.set_facecolor(base_color)
-                else:
-                    cell.set_facecolor(base_color)
+            table[(0, i)].set_text_props(weight='bold', color='white', fontsize=LABEL_FONTSIZE)
+        
+        # Status text coloring
+        status_text_colors = {"OK": '#155724', "WARNING": '#721c24'}
+        for i, status_text in enumerate(statuses, start=1):
+            if status_text in status_text_colors:
+                table[(i, 3)].set_text_props(weight='bold', color=status_text_colors[status_text])
         
         fig.suptitle('KPI Health Grid', fontsize=TITLE_FONTSIZE + 2, fontweight='bold', y=0.98)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
-            save_path = self.output_dir / "04_kpi_health_grid.png"
-            fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
+            save_path = self.output_dir / f"04_kpi_health_grid.{self.OUTPUT_FORMAT}"
+            _save_figure(fig, save_path)
             print(f"✓ Saved: {save_path}")
         
         return fig
@@ -442,13 +479,14 @@ class KPIVisualizer:
         Returns:
             Figure object
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=FIGSIZE_WIDE)
+        fig, (ax1, ax2) = self._new_figure(FIGSIZE_WIDE, 1, 2)
         
         # Sort by metric value
         segment_df_sorted = segment_df.sort_values(metric_col, ascending=False)
         
         # Plot 1: Metric by segment
-        bars = ax1.barh(segment_df_sorted.index, segment_df_sorted[metric_col],
+        metric_vals = segment_df_sorted[metric_col].to_numpy()
+        bars = ax1.barh(segment_df_sorted.index.to_numpy(), metric_vals,
                         color=COLOR_PRIMARY, edgecolor='black', alpha=0.7)
         
         ax1.set_xlabel(metric_col.upper(), fontsize=LABEL_FONTSIZE)
@@ -456,19 +494,20 @@ class KPIVisualizer:
                       fontsize=TITLE_FONTSIZE, fontweight='bold')
         ax1.grid(axis='x', alpha=0.3)
         
-        # Add value labels
-        for i, (idx, row) in enumerate(segment_df_sorted.iterrows()):
-            ax1.text(row[metric_col], i, f" {row[metric_col]:.2f}",
-                     va='center', fontsize=TICK_FONTSIZE, fontweight='bold')
+        # Add value labels just past the end of each bar
+        ax1.bar_label(bars, labels=[f"{v:.2f}" for v in metric_vals],
+                      padding=3, fontsize=TICK_FONTSIZE, fontweight='bold')
         
         # Plot 2: Customer and order share
         if 'customer_share' in segment_df.columns and 'order_share' in segment_df.columns:
             x = np.arange(len(segment_df_sorted))
             width = 0.35
+            customer_pct = segment_df_sorted['customer_share'].to_numpy() * 100
+            order_pct = segment_df_sorted['order_share'].to_numpy() * 100
             
-            ax2.bar(x - width/2, segment_df_sorted['customer_share'] * 100,
+            ax2.bar(x - width/2, customer_pct,
                     width, label='Customer Share', color=COLOR_SECONDARY, alpha=0.7)
-            ax2.bar(x + width/2, segment_df_sorted['order_share'] * 100,
+            ax2.bar(x + width/2, order_pct,
                     width, label='Order Share', color=COLOR_PRIMARY, alpha=0.7)
             
             ax2.set_ylabel('Share (%)', fontsize=LABEL_FONTSIZE)
@@ -479,11 +518,11 @@ class KPIVisualizer:
             ax2.legend(fontsize=TICK_FONTSIZE)
             ax2.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
-            save_path = self.output_dir / "03_segment_comparison.png"
-            fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
+            save_path = self.output_dir / f"03_segment_comparison.{self.OUTPUT_FORMAT}"
+            _save_figure(fig, save_path)
             print(f"✓ Saved: {save_path}")
         
         return fig
@@ -507,10 +546,10 @@ class KPIVisualizer:
         Returns:
             Figure object
         """
-        fig, ax = plt.subplots(figsize=FIGSIZE_STANDARD)
+        fig, ax = self._new_figure(FIGSIZE_STANDARD)
         
         # Plot histogram
-        ax.hist(data.dropna(), bins=bins, color=COLOR_PRIMARY,
+        ax.hist(data.dropna().to_numpy(), bins=bins, color=COLOR_PRIMARY,
                 edgecolor='black', alpha=0.7)
         
         # Add statistics
@@ -529,12 +568,12 @@ class KPIVisualizer:
         ax.legend(fontsize=TICK_FONTSIZE)
         ax.grid(axis='y', alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
-            filename = f"05_dist_{metric_name.lower().replace(' ', '_')}.png"
+            filename = f"05_dist_{metric_name.lower().replace(' ', '_')}.{self.OUTPUT_FORMAT}"
             save_path = self.output_dir / filename
-            fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
+            _save_figure(fig, save_path)
             print(f"✓ Saved: {save_path}")
         
         return fig
@@ -568,6 +607,7 @@ def create_kpi_flight_deck(
     n_metrics = len(exec_metrics)
     
     # Create figure
+    _apply_style()
     fig, ax = plt.subplots(figsize=(16, n_metrics * 0.8 + 2))
     ax.axis('off')
     
@@ -2,174 +2,554 @@
 Executive dashboard visualization combining multiple charts.
 """
 
-import matplotlib.pyplot as plt
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
 
-from .charts import KPIVisualizer
 from ..config import FIGURES_DIR, TITLE_FONTSIZE
+from ..metrics.formatting import format_value_series
 
+# matplotlib and PIL are imported inside the drawing functions, so importing
+# this module (e.g. from a metrics-only run) does not pay their import cost
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
-def create_executive_dashboard(
+
+# Metrics shown in the KPI summary panel, in display order
+_KEY_METRICS = pd.Index(['vpac', 'active_customers', 'orders_per_customer',
+                         'items_per_order', 'reorder_rate', 'small_basket_share'])
+
+# Fingerprint of the inputs last written to each dashboard path (most
+# recently used last)
+_DASHBOARD_CACHE: "OrderedDict[Path, str]" = OrderedDict()
+_DASHBOARD_CACHE_SIZE = 8
+_DASHBOARD_CACHE_LOCK = threading.Lock()
+
+# Above this many segments, panel 3 draws its bars as one PolyCollection
+_SEGMENT_COLLECTION_THRESHOLD = 50
+
+# Pooled dashboard figures by figsize (see reuse_fig); the lock is held for a
+# whole draw and save on a pooled figure
+_FIG_CACHE: "Dict[tuple, Figure]" = {}
+_FIG_CACHE_LOCK = threading.Lock()
+
+# Dashboard saves (waited on unless async_save); Agg can draw independent
+# figures on different threads
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Latest background save per pooled figure, so it is never cleared while
+# it is still being written
+_PENDING_SAVES: Dict[int, Future] = {}
+
+# Latest save per output path; each save waits for the previous one to the
+# same path, so two writers never interleave in one file (guarded by
+# _DASHBOARD_CACHE_LOCK)
+_PATH_SAVES: Dict[Path, Future] = {}
+
+
+def _dashboard_fingerprint(
     north_star_info: Dict,
     decomposition,
     segments: pd.DataFrame,
-    metrics_df: pd.DataFrame,
-    save: bool = True,
-    output_dir: Optional[Path] = None
-) -> plt.Figure:
+    summary: pd.DataFrame,
+    save_path: Path,
+    save_options: tuple = ()
+) -> str:
     """
-    Create a 2x2 executive dashboard combining key views.
+    Hash everything the saved dashboard image depends on.
     
-    Panels:
-    - Top left: North Star metric tree
-    - Top right: Driver waterfall
-    - Bottom left: Segment comparison
-    - Bottom right: KPI health grid summary
+    Returns:
+        Hex digest identifying the rendered output
+    """
+    key_rows = summary[['metric_name', 'display_name', 'value', 'unit']]
+    
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(save_path).encode())
+    h.update(repr(save_options).encode())
+    h.update(repr(north_star_info).encode())
+    h.update(repr(decomposition.driver_contributions).encode())
+    h.update(pd.util.hash_pandas_object(segments['vpac']).to_numpy().tobytes())
+    h.update(pd.util.hash_pandas_object(key_rows, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def select_key_metrics(metrics_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Select the rows shown in the dashboard's KPI summary panel.
+    
+    Callers that draw the dashboard repeatedly from the same metrics can
+    compute this once and pass it as create_executive_dashboard(summary=...).
     
     Args:
-        north_star_info: Dict with North Star value and components
-        decomposition: DecompositionResult from VPACDecomposer
-        segments: Customer segmentation DataFrame
         metrics_df: All metrics DataFrame
-        save: Whether to save the figure
-        output_dir: Output directory (defaults to FIGURES_DIR)
         
     Returns:
-        Figure object with 2x2 subplots
+        Key metric rows in display order, skipping any not computed; rows
+        sharing a metric_name keep their relative order
     """
-    output_dir = output_dir or FIGURES_DIR
-    output_dir.mkdir(parents=True, exist_ok=True)
+    key_rows = metrics_df.loc[metrics_df['metric_name'].isin(_KEY_METRICS)]
+    rank = pd.Categorical(key_rows['metric_name'], categories=_KEY_METRICS).codes
+    return key_rows.iloc[np.argsort(rank, kind='stable')]
+
+
+@lru_cache(maxsize=16)
+def _pil_font(font_px: int, weight: str = 'normal', style: str = 'normal'):
+    """Load the sans-serif font matplotlib would use, as a PIL font of the given size."""
+    from matplotlib.font_manager import FontProperties, findfont
+    from PIL import ImageFont
+    
+    prop = FontProperties(family=['sans-serif'], weight=weight, style=style)
+    return ImageFont.truetype(findfont(prop), font_px)
+
+
+def _north_star_labels(vpac_val: float, orders_val: float, items_val: float) -> list:
+    """
+    Metric tree labels of panel 1 as (x, y, text, points, weight, style, color).
+    
+    Positions are in the panel's 0-10 data coordinates; a color of None means
+    the default text color.
+    """
+    return [
+        (5, 8, 'NORTH STAR', 14, 'bold', 'normal', '#1f77b4'),
+        (5, 7.3, f'VPAC: {vpac_val:.2f}', 18, 'bold', 'normal', None),
+        (5, 6.5, 'items/customer', 10, 'normal', 'italic', None),
+        # Drivers
+        (2.5, 3.5, 'Orders/Customer', 12, 'bold', 'normal', None),
+        (2.5, 2.8, f'{orders_val:.2f}', 14, 'normal', 'normal', None),
+        (7.5, 3.5, 'Items/Order', 12, 'bold', 'normal', None),
+        (7.5, 2.8, f'{items_val:.2f}', 14, 'normal', 'normal', None),
+    ]
+
+
+@lru_cache(maxsize=64)
+def _render_north_star_text(
+    vpac_val: float,
+    orders_val: float,
+    items_val: float,
+    width_px: int,
+    height_px: int,
+    dpi: int
+) -> np.ndarray:
+    """
+    Rasterize the metric tree labels of panel 1 into a transparent RGBA array.
+    
+    Text is centered on its baseline, as with ax.text(..., ha='center').
+    
+    Returns:
+        Array of shape (height_px, width_px, 4)
+    """
+    from PIL import Image, ImageDraw
+    
+    img = Image.new('RGBA', (width_px, height_px), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(img)
+    for x, y, text, points, weight, style, color in _north_star_labels(vpac_val, orders_val, items_val):
+        font = _pil_font(round(points / 72 * dpi), weight, style)
+        xy = (x / 10 * width_px, (1 - y / 10) * height_px)
+        # '#262626' is the style's default text color (0.15 grey)
+        draw.text(xy, text, font=font, fill=color or '#262626', anchor='ms')
+    
+    return np.asarray(img)
+
+
+@lru_cache(maxsize=8)
+def _render_summary_table(
+    rows: Tuple[Tuple[str, str], ...],
+    width_px: int,
+    row_px: int,
+    font_px: int
+) -> np.ndarray:
+    """
+    Rasterize the KPI summary table into an RGBA array.
+    
+    One image replaces the dozens of Cell artists a matplotlib table needs.
+    Layout matches the previous ax.table: a blue bold header, alternating
+    row shading, a 65/35 column split and left-aligned body text.
     
-    fig = plt.figure(figsize=(20, 14))
+    Args:
+        rows: (metric, value) display strings
+        width_px: Image width in pixels
+        row_px: Height of each row in pixels
+        font_px: Font size in pixels
+        
+    Returns:
+        Array of shape (row_px * (len(rows) + 1), width_px, 4)
+    """
+    from PIL import Image, ImageDraw
+    
+    font = _pil_font(font_px)
+    bold = _pil_font(font_px, 'bold')
+    
+    height_px = row_px * (len(rows) + 1)
+    img = Image.new('RGBA', (width_px, height_px), 'white')
+    draw = ImageDraw.Draw(img)
+    col_edges = [0, round(width_px * 0.65), width_px - 1]
+    # 1pt cell edges, as in the matplotlib table
+    edge_px = max(1, round(font_px / 11))
+    
+    for r, cells in enumerate((('Metric', 'Value'),) + rows):
+        top = r * row_px
+        middle = top + row_px // 2
+        fill = '#1f77b4' if r == 0 else ('#f0f0f0' if r % 2 == 0 else 'white')
+        
+        for c, text in enumerate(cells):
+            left, right = col_edges[c], col_edges[c + 1]
+            draw.rectangle([left, top, right, min(top + row_px, height_px - 1)],
+                           fill=fill, outline='black', width=edge_px)
+            if r == 0:
+                draw.text(((left + right) // 2, middle), text, font=bold, fill='white', anchor='mm')
+            else:
+                # Same 10% inset as a left-aligned matplotlib table cell
+                pad = (right - left) // 10
+                draw.text((left + pad, middle), text, font=font, fill='#262626', anchor='lm')
+    
+    return np.asarray(img)
+
+
+def _new_figure(figsize: Tuple[float, float]) -> "Figure":
+    """
+    Create a headless Agg figure outside pyplot's figure manager.
+    
+    The figure is never registered with pyplot, so callers need no
+    plt.close() and it is freed as soon as it is dropped.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _save_after(
+    previous: Optional[Future],
+    fig: "Figure",
+    save_path: Path,
+    key: str,
+    dpi: int,
+    compress_level: int
+) -> None:
+    """Write the dashboard once the previous save to the same path is done."""
+    from .charts import _save_figure
     
-    # Create 2x2 grid
-    gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.25)
+    if previous is not None:
+        wait([previous])
+    _save_figure(fig, save_path, dpi=dpi, compress_level=compress_level, tight=False)
+    _remember_saved(key, save_path)
+
+
+def _forget_save(save_path: Path, future: Future) -> None:
+    """Drop a finished save from _PATH_SAVES unless a newer one replaced it."""
+    with _DASHBOARD_CACHE_LOCK:
+        if _PATH_SAVES.get(save_path) is future:
+            del _PATH_SAVES[save_path]
+
+
+def _remember_saved(key: str, save_path: Path) -> None:
+    """Record the fingerprint now on disk at save_path, evicting the oldest path."""
+    with _DASHBOARD_CACHE_LOCK:
+        _DASHBOARD_CACHE[save_path] = key
+        _DASHBOARD_CACHE.move_to_end(save_path)
+        if len(_DASHBOARD_CACHE) > _DASHBOARD_CACHE_SIZE:
+            _DASHBOARD_CACHE.popitem(last=False)
+
+
+def _draw_north_star_panel(
+    ax,
+    north_star_info: Dict,
+    figsize: Tuple[float, float],
+    raster_dpi: Optional[int] = None
+) -> None:
+    """
+    Panel 1: simplified VPAC metric tree.
     
-    # Panel 1: Metric Tree (top left)
-    ax1 = fig.add_subplot(gs[0, 0])
-    ax1.axis('off')
-    ax1.set_xlim(0, 10)
-    ax1.set_ylim(0, 10)
+    With raster_dpi, the labels are one image pre-rendered for a PNG saved
+    at that dpi; otherwise they are matplotlib text.
+    """
+    ax.axis('off')
     
     # Simplified metric tree
     vpac_val = north_star_info['value']
     orders_val = north_star_info['components'].get('orders_per_customer', 0)
     items_val = north_star_info['components'].get('items_per_order', 0)
     
-    ax1.text(5, 8, 'NORTH STAR', ha='center', fontsize=14, weight='bold', color='#1f77b4')
-    ax1.text(5, 7.3, f'VPAC: {vpac_val:.2f}', ha='center', fontsize=18, weight='bold')
-    ax1.text(5, 6.5, 'items/customer', ha='center', fontsize=10, style='italic')
-    
-    # Drivers
-    ax1.text(2.5, 3.5, 'Orders/Customer', ha='center', fontsize=12, weight='bold')
-    ax1.text(2.5, 2.8, f'{orders_val:.2f}', ha='center', fontsize=14)
-    
-    ax1.text(7.5, 3.5, 'Items/Order', ha='center', fontsize=12, weight='bold')
-    ax1.text(7.5, 2.8, f'{items_val:.2f}', ha='center', fontsize=14)
+    if raster_dpi is not None:
+        bbox = ax.get_position()
+        labels_img = _render_north_star_text(
+            round(vpac_val, 2), round(orders_val, 2), round(items_val, 2),
+            width_px=round(bbox.width * figsize[0] * raster_dpi),
+            height_px=round(bbox.height * figsize[1] * raster_dpi),
+            dpi=raster_dpi
+        )
+        ax.imshow(labels_img, extent=(0, 10, 0, 10), aspect='auto', interpolation='antialiased')
+    else:
+        for x, y, text, points, weight, style, color in _north_star_labels(vpac_val, orders_val, items_val):
+            ax.text(x, y, text, ha='center', fontsize=points, weight=weight, style=style, color=color)
+    ax.set_xlim(0, 10)
+    ax.set_ylim(0, 10)
     
     # Arrows
-    ax1.annotate('', xy=(5, 6.2), xytext=(2.5, 4),
+    ax.annotate('', xy=(5, 6.2), xytext=(2.5, 4),
                 arrowprops=dict(arrowstyle='->', lw=2, color='gray'))
-    ax1.annotate('', xy=(5, 6.2), xytext=(7.5, 4),
+    ax.annotate('', xy=(5, 6.2), xytext=(7.5, 4),
                 arrowprops=dict(arrowstyle='->', lw=2, color='gray'))
     
-    ax1.set_title('1. North Star Metric', fontsize=TITLE_FONTSIZE, weight='bold', pad=10)
+    ax.set_title('1. North Star Metric', fontsize=TITLE_FONTSIZE, weight='bold', pad=10)
+
+
+def _draw_driver_panel(ax, decomposition) -> None:
+    """Panel 2: driver contributions as a bar chart."""
+    # Driver names and contributions as arrays; hide a negligible interaction
+    driver_keys = np.array(list(decomposition.driver_contributions), dtype=str)
+    contribs = np.fromiter(decomposition.driver_contributions.values(),
+                           dtype=np.float64, count=len(driver_keys))
+    shown = (driver_keys != 'interaction') | (np.abs(contribs) > 0.01)
+    drivers = np.char.title(np.char.replace(driver_keys[shown], '_', ' '))
+    contributions = contribs[shown]
     
-    # Panel 2: Driver Waterfall (top right)
-    ax2 = fig.add_subplot(gs[0, 1])
+    x_pos = range(len(drivers))
+    colors = np.where(contributions >= 0, '#2ecc71', '#e74c3c')
     
-    drivers = []
-    contributions = []
-    for driver, contrib in decomposition.driver_contributions.items():
-        if driver != 'interaction' or abs(contrib) > 0.01:
-            drivers.append(driver.replace('_', ' ').title())
-            contributions.append(contrib)
+    ax.bar(x_pos, contributions, color=colors, alpha=0.7, edgecolor='black')
+    ax.axhline(y=0, color='black', linestyle='-', linewidth=1)
+    ax.set_xticks(x_pos)
+    ax.set_xticklabels(drivers, rotation=15, ha='right')
+    ax.set_ylabel('Contribution', fontsize=12)
+    ax.set_title('2. Driver Attribution', fontsize=TITLE_FONTSIZE, weight='bold', pad=10)
+    ax.grid(axis='y', alpha=0.3)
+
+
+def _draw_segment_panel(ax, segments: pd.DataFrame) -> None:
+    """Panel 3: VPAC by customer segment, largest first."""
+    from matplotlib.collections import PolyCollection
     
-    x_pos = range(len(drivers))
-    colors = ['#2ecc71' if c >= 0 else '#e74c3c' for c in contributions]
-    
-    ax2.bar(x_pos, contributions, color=colors, alpha=0.7, edgecolor='black')
-    ax2.axhline(y=0, color='black', linestyle='-', linewidth=1)
-    ax2.set_xticks(x_pos)
-    ax2.set_xticklabels(drivers, rotation=15, ha='right')
-    ax2.set_ylabel('Contribution', fontsize=12)
-    ax2.set_title('2. Driver Attribution', fontsize=TITLE_FONTSIZE, weight='bold', pad=10)
-    ax2.grid(axis='y', alpha=0.3)
-    
-    # Panel 3: Segment Comparison (bottom left)
-    ax3 = fig.add_subplot(gs[1, 0])
-    
-    segments_plot = segments.sort_values('vpac', ascending=False)
-    y_pos = range(len(segments_plot))
-    
-    ax3.barh(y_pos, segments_plot['vpac'], color='#3498db', alpha=0.7, edgecolor='black')
-    ax3.set_yticks(y_pos)
-    ax3.set_yticklabels(segments_plot.index)
-    ax3.set_xlabel('VPAC', fontsize=12)
-    ax3.set_title('3. Customer Segments', fontsize=TITLE_FONTSIZE, weight='bold', pad=10)
-    ax3.grid(axis='x', alpha=0.3)
-    
-    # Panel 4: KPI Summary Table (bottom right)
-    ax4 = fig.add_subplot(gs[1, 1])
-    ax4.axis('off')
-    
-    # Select key metrics for summary
-    key_metrics = ['vpac', 'active_customers', 'orders_per_customer', 
-                   'items_per_order', 'reorder_rate', 'small_basket_share']
-    
-    summary_data = []
-    for _, row in metrics_df.iterrows():
-        if row['metric_name'] in key_metrics:
-            display_name = row['display_name']
-            value = row['value']
-            unit = row['unit']
-            
-            # Format value
-            if unit == 'rate':
-                value_str = f"{value:.1%}"
-            elif unit in ['customers', 'orders', 'items']:
-                value_str = f"{value:,.0f}"
+    # Largest VPAC first; a stable argsort keeps sort_values' order for ties
+    # and NaNs without copying the whole frame
+    vpac_all = segments['vpac'].to_numpy(dtype=np.float64)
+    order = np.argsort(-vpac_all, kind='stable')
+    vpac_vals = vpac_all[order]
+    labels = segments.index.to_numpy()[order]
+    y_pos = range(len(vpac_vals))
+    
+    if len(vpac_vals) > _SEGMENT_COLLECTION_THRESHOLD:
+        # One collection instead of a Rectangle artist per bar
+        # (same geometry as barh: centered on y, height 0.8, starting at 0)
+        y = np.arange(len(vpac_vals), dtype=np.float64)
+        zeros = np.zeros_like(vpac_vals)
+        verts = np.stack([
+            np.column_stack([zeros, y - 0.4]),
+            np.column_stack([vpac_vals, y - 0.4]),
+            np.column_stack([vpac_vals, y + 0.4]),
+            np.column_stack([zeros, y + 0.4]),
+        ], axis=1)
+        bars = PolyCollection(verts, facecolors='#3498db', edgecolors='black', alpha=0.7)
+        bars.sticky_edges.x.append(0)
+        ax.add_collection(bars)
+        ax.autoscale_view()
+    else:
+        ax.barh(y_pos, vpac_vals, color='#3498db', alpha=0.7, edgecolor='black')
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(labels)
+    ax.set_xlabel('VPAC', fontsize=12)
+    ax.set_title('3. Customer Segments', fontsize=TITLE_FONTSIZE, weight='bold', pad=10)
+    ax.grid(axis='x', alpha=0.3)
+
+
+def _draw_summary_panel(
+    ax,
+    summary: pd.DataFrame,
+    figsize: Tuple[float, float],
+    raster_dpi: Optional[int] = None
+) -> None:
+    """
+    Panel 4: key metrics table.
+    
+    With raster_dpi, the table is one image pre-rendered for a PNG saved at
+    that dpi; otherwise it is a matplotlib table that stays vector text.
+    """
+    ax.axis('off')
+    
+    value_strs = format_value_series(summary['value'], summary['unit'], days_suffix=False)
+    summary_data = tuple(zip(summary['display_name'], value_strs))
+    
+    if raster_dpi is not None:
+        # One pre-rendered image, sized to the panel at the save resolution:
+        # 11pt text, 0.41in rows, vertically centered
+        bbox = ax.get_position()
+        panel_w_in = bbox.width * figsize[0]
+        panel_h_in = bbox.height * figsize[1]
+        row_in = 0.41
+        table_img = _render_summary_table(
+            summary_data,
+            width_px=round(panel_w_in * raster_dpi),
+            row_px=round(row_in * raster_dpi),
+            font_px=round(11 / 72 * raster_dpi)
+        )
+        table_h = (len(summary_data) + 1) * row_in / panel_h_in
+        ax.imshow(table_img, extent=(0, 1, 0.5 - table_h / 2, 0.5 + table_h / 2),
+                  aspect='auto', interpolation='antialiased')
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+    else:
+        table = ax.table(
+            cellText=[list(row) for row in summary_data],
+            colLabels=['Metric', 'Value'],
+            cellLoc='left',
+            loc='center',
+            colWidths=[0.65, 0.35]
+        )
+        
+        table.auto_set_font_size(False)
+        table.set_fontsize(11)
+        table.scale(1, 2.5)
+        
+        # Header styling
+        for i in range(2):
+            cell = table[(0, i)]
+            cell.set_facecolor('#1f77b4')
+            cell.set_text_props(weight='bold', color='white')
+        
+        # Alternating rows
+        for i in range(2, len(summary_data) + 1, 2):
+            for j in range(2):
+                table[(i, j)].set_facecolor('#f0f0f0')
+    
+    ax.set_title('4. KPI Summary', fontsize=TITLE_FONTSIZE, weight='bold', pad=10)
+
+
+def create_executive_dashboard(
+    north_star_info: Dict,
+    decomposition,
+    segments: pd.DataFrame,
+    metrics_df: pd.DataFrame,
+    save: bool = True,
+    output_dir: Optional[Path] = None,
+    dpi: int = 150,
+    compress_level: int = 3,
+    reuse_fig: bool = False,
+    async_save: bool = False,
+    summary: Optional[pd.DataFrame] = None
+) -> Union["Figure", Tuple["Figure", Optional[Future]]]:
+    """
+    Create a 2x2 executive dashboard combining key views.
+    
+    Panels:
+    - Top left: North Star metric tree
+    - Top right: Driver waterfall
+    - Bottom left: Segment comparison
+    - Bottom right: KPI health grid summary
+    
+    Args:
+        north_star_info: Dict with North Star value and components
+        decomposition: DecompositionResult from VPACDecomposer
+        segments: Customer segmentation DataFrame
+        metrics_df: All metrics DataFrame
+        save: Whether to save the figure; skipped when the file at the save
+            path was last written from these same inputs and is still there
+        output_dir: Output directory (defaults to FIGURES_DIR)
+        dpi: Resolution of the saved PNG. Text-heavy panels are pre-rendered
+            at this dpi when saving a PNG; re-saving the returned figure at
+            another dpi resamples them.
+        compress_level: zlib level (0-9) for the saved PNG; low levels encode
+            several times faster for a slightly larger file
+        reuse_fig: Clear and redraw one pooled Figure instead of allocating a
+            new one. The returned figure is only valid until the next call;
+            concurrent calls take turns on the pooled figure.
+        async_save: Encode and write the image on a background thread and
+            return immediately. Do not modify the figure until the returned
+            future is done.
+        summary: Key metric rows from select_key_metrics(metrics_df); pass
+            a precomputed one to skip re-selecting them on every call
+        
+    Returns:
+        Figure object with 2x2 subplots; with async_save, a (figure, future)
+        tuple where the future resolves once the file is written (None when
+        nothing is being saved)
+    """
+    from .charts import KPIVisualizer, _apply_style
+    
+    if summary is None:
+        summary = select_key_metrics(metrics_df)
+    
+    output_dir = output_dir or FIGURES_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    _apply_style()
+    figsize = (20, 14)
+    # A pooled figure stays locked from clearing through drawing and saving
+    # (a background save is waited on by the next caller), so concurrent
+    # reuse_fig calls take turns instead of drawing into it at once
+    with _FIG_CACHE_LOCK if reuse_fig else nullcontext():
+        if reuse_fig:
+            fig = _FIG_CACHE.get(figsize)
+            if fig is None:
+                fig = _new_figure(figsize)
+                _FIG_CACHE[figsize] = fig
+            else:
+                pending = _PENDING_SAVES.pop(id(fig), None)
+                if pending is not None:
+                    wait([pending])
+                fig.clear()
+        else:
+            fig = _new_figure(figsize)
+        
+        # Text-heavy panels are pre-rendered as images only for a PNG saved at
+        # this dpi; on-screen figures and vector output keep matplotlib text
+        save_path = output_dir / f'00_executive_dashboard.{KPIVisualizer.OUTPUT_FORMAT}'
+        raster_dpi = dpi if save and save_path.suffix == '.png' else None
+        
+        # Create 2x2 grid with fixed margins, so saving needs no tight-bbox pass
+        fig.subplots_adjust(left=0.06, right=0.98, top=0.93, bottom=0.06)
+        gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.25)
+        
+        # Each panel draws only on its own axes; they are built in turn because
+        # matplotlib artists on one figure are not safe to create concurrently
+        _draw_north_star_panel(fig.add_subplot(gs[0, 0]), north_star_info, figsize, raster_dpi)
+        _draw_driver_panel(fig.add_subplot(gs[0, 1]), decomposition)
+        _draw_segment_panel(fig.add_subplot(gs[1, 0]), segments)
+        _draw_summary_panel(fig.add_subplot(gs[1, 1]), summary, figsize, raster_dpi)
+        
+        # Overall title
+        fig.suptitle('Executive Dashboard: KPI Overview',
+                    fontsize=TITLE_FONTSIZE + 4, weight='bold', y=0.98)
+        
+        future = None
+        if save:
+            key = _dashboard_fingerprint(north_star_info, decomposition, segments,
+                                         summary, save_path, (dpi, compress_level))
+        
+            with _DASHBOARD_CACHE_LOCK:
+                unchanged = _DASHBOARD_CACHE.get(save_path) == key and save_path.exists()
+                if unchanged:
+                    _DASHBOARD_CACHE.move_to_end(save_path)
+                else:
+                    # The file is about to hold other inputs; forget what it had.
+                    # Saves to one path are queued behind each other and record
+                    # their fingerprint only once written, in write order.
+                    _DASHBOARD_CACHE.pop(save_path, None)
+                    future = _SAVE_POOL.submit(_save_after, _PATH_SAVES.get(save_path), fig,
+                                               save_path, key, dpi, compress_level)
+                    _PATH_SAVES[save_path] = future
+        
+            if unchanged:
+                print(f"✓ Unchanged: {save_path}")
             else:
-                value_str = f"{value:.2f}"
-            
-            summary_data.append([display_name, value_str])
-    
-    table = ax4.table(
-        cellText=summary_data,
-        colLabels=['Metric', 'Value'],
-        cellLoc='left',
-        loc='center',
-        colWidths=[0.65, 0.35]
-    )
-    
-    table.auto_set_font_size(False)
-    table.set_fontsize(11)
-    table.scale(1, 2.5)
-    
-    # Header styling
-    for i in range(2):
-        cell = table[(0, i)]
-        cell.set_facecolor('#1f77b4')
-        cell.set_text_props(weight='bold', color='white')
-    
-    # Alternating rows
-    for i in range(1, len(summary_data) + 1):
-        for j in range(2):
-            cell = table[(i, j)]
-            if i % 2 == 0:
-                cell.set_facecolor('#f0f0f0')
-    
-    ax4.set_title('4. KPI Summary', fontsize=TITLE_FONTSIZE, weight='bold', pad=10)
-    
-    # Overall title
-    fig.suptitle('Executive Dashboard: KPI Overview',
-                fontsize=TITLE_FONTSIZE + 4, weight='bold', y=0.98)
-    
-    if save:
-        save_path = output_dir / '00_executive_dashboard.png'
-        fig.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
-        print(f"✓ Saved: {save_path}")
+                future.add_done_callback(lambda done, path=save_path: _forget_save(path, done))
+                if async_save:
+                    if reuse_fig:
+                        _PENDING_SAVES[id(fig)] = future
+                    print(f"✓ Saving in background: {save_path}")
+                else:
+                    future.result()
+                    print(f"✓ Saved: {save_path}")
     
+    if async_save:
+        return fig, future
     return fig
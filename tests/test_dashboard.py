@@ -0,0 +1,211 @@
+"""
+Unit tests for the executive dashboard.
+"""
+
+import hashlib
+import threading
+import time
+
+import pytest
+import pandas as pd
+from src.analysis.decomposition import VPACDecomposer
+from src.viz import charts, dashboard
+from src.viz.dashboard import create_executive_dashboard, select_key_metrics
+
+
+@pytest.fixture(scope='module')
+def dashboard_inputs():
+    """Small but complete set of dashboard inputs."""
+    decomposition = VPACDecomposer().decompose_vpac_change(
+        {'vpac': 50.0, 'orders_per_customer': 5.0, 'items_per_order': 10.0},
+        {'vpac': 66.0, 'orders_per_customer': 6.0, 'items_per_order': 11.0}
+    )
+    segments = pd.DataFrame(
+        {'customer_count': [10, 20, 30], 'vpac': [10.0, 40.5, 110.2]},
+        index=['One-time', 'Occasional', 'Regular']
+    )
+    metrics_df = pd.DataFrame({
+        'metric_name': ['vpac', 'orders_per_customer', 'reorder_rate'],
+        'display_name': ['Value per Active Customer (VPAC)', 'Orders per Customer', 'Reorder Rate'],
+        'value': [66.0, 6.0, 0.44],
+        'unit': ['items/customer', 'orders/customer', 'rate'],
+    })
+    return decomposition, segments, metrics_df
+
+
+def _file_md5(path):
+    return hashlib.md5(path.read_bytes()).hexdigest()
+
+
+class TestSelectKeyMetrics:
+    """Test the rows chosen for the KPI summary panel."""
+    
+    def test_rows_in_display_order(self):
+        """Key metrics come out in display order, other metrics are dropped."""
+        metrics_df = pd.DataFrame({
+            'metric_name': ['reorder_rate', 'median_days_since_prior', 'vpac', 'items_per_order'],
+            'display_name': ['Reorder Rate', 'Median Days', 'VPAC', 'Items per Order'],
+        })
+        
+        summary = select_key_metrics(metrics_df)
+        
+        assert list(summary['metric_name']) == ['vpac', 'items_per_order', 'reorder_rate']
+    
+    def test_repeated_metric_names_kept(self):
+        """Repeated metric names do not fail and keep their input order."""
+        metrics_df = pd.DataFrame({
+            'metric_name': ['reorder_rate', 'vpac', 'reorder_rate'],
+            'display_name': ['Reorder Rate (web)', 'VPAC', 'Reorder Rate (app)'],
+        })
+        
+        summary = select_key_metrics(metrics_df)
+        
+        assert list(summary['display_name']) == ['VPAC', 'Reorder Rate (web)', 'Reorder Rate (app)']
+
+
+class TestDashboardRendering:
+    """Test when text-heavy panels are pre-rendered as images."""
+    
+    def test_unsaved_figure_keeps_vector_table(self, dashboard_inputs):
+        """A figure that is not saved draws the KPI summary as a matplotlib table."""
+        decomposition, segments, metrics_df = dashboard_inputs
+        north_star = {'value': 66.0, 'components': {'orders_per_customer': 6.0, 'items_per_order': 11.0}}
+        
+        fig = create_executive_dashboard(north_star, decomposition, segments, metrics_df, save=False)
+        
+        summary_ax = fig.axes[3]
+        assert len(summary_ax.tables) == 1
+        assert len(summary_ax.images) == 0
+        assert len(fig.axes[0].images) == 0
+        assert 'NORTH STAR' in [text.get_text() for text in fig.axes[0].texts]
+    
+    def test_svg_output_has_no_bitmaps(self, dashboard_inputs, tmp_path, monkeypatch):
+        """A vector dashboard keeps all text as text, with no embedded images."""
+        decomposition, segments, metrics_df = dashboard_inputs
+        north_star = {'value': 66.0, 'components': {'orders_per_customer': 6.0, 'items_per_order': 11.0}}
+        monkeypatch.setattr(charts.KPIVisualizer, 'OUTPUT_FORMAT', 'svg')
+        
+        create_executive_dashboard(north_star, decomposition, segments, metrics_df,
+                                   output_dir=tmp_path)
+        
+        svg = (tmp_path / '00_executive_dashboard.svg').read_text()
+        assert '<image' not in svg
+    
+    def test_saved_png_uses_prerendered_table(self, dashboard_inputs, tmp_path):
+        """A figure saved as PNG draws the KPI summary as one image."""
+        decomposition, segments, metrics_df = dashboard_inputs
+        north_star = {'value': 66.0, 'components': {'orders_per_customer': 6.0, 'items_per_order': 11.0}}
+        
+        fig = create_executive_dashboard(north_star, decomposition, segments, metrics_df,
+                                         output_dir=tmp_path, dpi=20)
+        
+        summary_ax = fig.axes[3]
+        assert len(summary_ax.tables) == 0
+        assert len(summary_ax.images) == 1
+        assert len(fig.axes[0].images) == 1
+    
+    def test_concurrent_reuse_fig_calls_take_turns(self, dashboard_inputs, monkeypatch):
+        """Two threads sharing the pooled figure never draw into it at once."""
+        decomposition, segments, metrics_df = dashboard_inputs
+        north_star = {'value': 66.0, 'components': {'orders_per_customer': 6.0, 'items_per_order': 11.0}}
+        
+        # Make the first draw slow, so a second caller arrives mid-draw
+        draw_driver_panel = dashboard._draw_driver_panel
+        delays = iter([0.5])
+        
+        def slow_draw_driver_panel(*args, **kwargs):
+            time.sleep(next(delays, 0))
+            draw_driver_panel(*args, **kwargs)
+        
+        monkeypatch.setattr(dashboard, '_draw_driver_panel', slow_draw_driver_panel)
+        
+        figs = []
+        
+        def draw():
+            figs.append(create_executive_dashboard(north_star, decomposition, segments,
+                                                   metrics_df, save=False, reuse_fig=True))
+        
+        threads = [threading.Thread(target=draw) for _ in range(2)]
+        threads[0].start()
+        time.sleep(0.1)
+        threads[1].start()
+        for thread in threads:
+            thread.join()
+        
+        assert figs[0] is figs[1]
+        assert len(figs[0].axes) == 4
+
+
+class TestDashboardSaveCache:
+    """Test that skipped saves never leave stale images on disk."""
+    
+    def test_save_skipped_for_same_inputs(self, dashboard_inputs, tmp_path):
+        """Saving the same inputs twice writes the file only once."""
+        decomposition, segments, metrics_df = dashboard_inputs
+        north_star = {'value': 66.0, 'components': {'orders_per_customer': 6.0, 'items_per_order': 11.0}}
+        
+        create_executive_dashboard(north_star, decomposition, segments, metrics_df,
+                                   output_dir=tmp_path, dpi=20)
+        path = next(tmp_path.iterdir())
+        mtime = path.stat().st_mtime_ns
+        
+        create_executive_dashboard(north_star, decomposition, segments, metrics_df,
+                                   output_dir=tmp_path, dpi=20)
+        assert path.stat().st_mtime_ns == mtime
+    
+    def test_alternating_inputs_rewrite_file(self, dashboard_inputs, tmp_path):
+        """Saving A, then B, then A again leaves A's dashboard on disk."""
+        decomposition, segments, metrics_df = dashboard_inputs
+        north_star_a = {'value': 66.0, 'components': {'orders_per_customer': 6.0, 'items_per_order': 11.0}}
+        north_star_b = {'value': 50.0, 'components': {'orders_per_customer': 5.0, 'items_per_order': 10.0}}
+        
+        def save(north_star):
+            create_executive_dashboard(north_star, decomposition, segments, metrics_df,
+                                       output_dir=tmp_path, dpi=20)
+            return _file_md5(next(tmp_path.iterdir()))
+        
+        md5_a = save(north_star_a)
+        md5_b = save(north_star_b)
+        assert md5_b != md5_a
+        assert save(north_star_a) == md5_a
+        assert len(dashboard._DASHBOARD_CACHE) <= dashboard._DASHBOARD_CACHE_SIZE
+
+    def test_background_saves_to_one_path_run_in_order(self, dashboard_inputs, tmp_path, monkeypatch):
+        """Two background saves of different inputs leave the later one on disk."""
+        decomposition, segments, metrics_df = dashboard_inputs
+        north_star_a = {'value': 66.0, 'components': {'orders_per_customer': 6.0, 'items_per_order': 11.0}}
+        north_star_b = {'value': 50.0, 'components': {'orders_per_customer': 5.0, 'items_per_order': 10.0}}
+        
+        def save(north_star, out, **kwargs):
+            return create_executive_dashboard(north_star, decomposition, segments, metrics_df,
+                                              output_dir=out, dpi=20, **kwargs)
+        
+        save(north_star_a, tmp_path / 'a')
+        save(north_star_b, tmp_path / 'b')
+        md5_a = _file_md5(next((tmp_path / 'a').iterdir()))
+        md5_b = _file_md5(next((tmp_path / 'b').iterdir()))
+        
+        # Make the first background save the slow one
+        save_figure = charts._save_figure
+        delays = iter([0.5])
+        
+        def slow_save_figure(*args, **kwargs):
+            time.sleep(next(delays, 0))
+            save_figure(*args, **kwargs)
+        
+        monkeypatch.setattr(charts, '_save_figure', slow_save_figure)
+        
+        out = tmp_path / 'async'
+        _, first = save(north_star_a, out, async_save=True)
+        _, second = save(north_star_b, out, async_save=True)
+        first.result()
+        second.result()
+        assert _file_md5(next(out.iterdir())) == md5_b
+        
+        # Only the inputs actually on disk count as already saved
+        save(north_star_a, out)
+        assert _file_md5(next(out.iterdir())) == md5_a
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -104,7 +104,26 @@ class TestVPACDecomposer:
         items_contrib = result.driver_contributions['items_per_order']
         
         assert abs(items_contrib) > abs(orders_contrib)
-    
+
+    def test_sorted_drivers_by_magnitude(self, decomposer):
+        """Test that drivers are ordered by absolute contribution."""
+        result = DecompositionResult(
+            metric_name='vpac',
+            total_change=-4.0,
+            absolute_change=-4.0,
+            percent_change=-0.08,
+            driver_contributions={
+                'orders_per_customer': 1.0,
+                'items_per_order': -5.0,
+                'interaction': 0.0,
+            },
+            period_start='P1',
+            period_end='P2'
+        )
+
+        names = [driver for driver, _ in result.sorted_drivers]
+        assert names == ['items_per_order', 'orders_per_customer', 'interaction']
+
     def test_validation_fails_on_bad_decomposition(self, decomposer):
         """Test that validation catches incorrect decompositions."""
         # Manually create a bad decomposition
@@ -20,12 +20,23 @@ from src.metrics.definitions import (
 )
 
 
+def _make_frame(columns: dict) -> pd.DataFrame:
+    """Build a test frame with int32 columns for all-int lists, float32 otherwise."""
+    return pd.DataFrame({
+        name: np.asarray(
+            values,
+            dtype=np.int32 if all(isinstance(v, int) for v in values) else np.float32
+        )
+        for name, values in columns.items()
+    })
+
+
 class TestEdgeCases:
     """Test metric behavior with unusual but valid data."""
     
     def test_single_customer_single_order(self):
         """Minimal valid dataset: 1 customer, 1 order."""
-        data = pd.DataFrame({
+        data = _make_frame({
             'user_id': [1],
             'orders': [1],
             'items': [5],
@@ -47,7 +58,7 @@ class TestEdgeCases:
     
     def test_no_reorders(self):
         """All customers are first-time purchasers."""
-        data = pd.DataFrame({
+        data = _make_frame({
             'user_id': [1, 2, 3],
             'orders': [1, 1, 1],
             'items': [10, 8, 12],
@@ -63,7 +74,7 @@ class TestEdgeCases:
     
     def test_all_reorders(self):
         """Every item is a reorder (ceiling case)."""
-        data = pd.DataFrame({
+        data = _make_frame({
             'user_id': [1, 2],
             'orders': [10, 15],
             'items': [100, 150],
@@ -79,7 +90,7 @@ class TestEdgeCases:
     
     def test_extreme_power_user(self):
         """One customer with 1000 orders (stress test)."""
-        data = pd.DataFrame({
+        data = _make_frame({
             'user_id': [1, 2],
             'orders': [1000, 5],
             'items': [10000, 50],
@@ -96,7 +107,7 @@ class TestEdgeCases:
     
     def test_all_small_baskets(self):
         """Everyone orders ≤3 items (quality alarm)."""
-        data = pd.DataFrame({
+        data = _make_frame({
             'user_id': [1, 2, 3],
             'orders': [5, 8, 3],
             'items': [15, 24, 9],
@@ -113,7 +124,7 @@ class TestEdgeCases:
     
     def test_mixed_null_days_since_prior(self):
         """Some users have NULL days_since_prior (first orders)."""
-        data = pd.DataFrame({
+        data = _make_frame({
             'user_id': [1, 2, 3, 4],
             'orders': [1, 5, 10, 2],
             'items': [10, 50, 100, 20],
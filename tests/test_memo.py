@@ -0,0 +1,103 @@
+"""
+Unit tests for the weekly business review memo.
+"""
+
+from datetime import datetime
+
+import pytest
+import pandas as pd
+from src.reporting import memo
+from src.reporting.memo import KPIReportBuilder, partition_metrics
+
+
+@pytest.fixture
+def builder(tmp_path):
+    """Create a report builder writing to a temporary directory."""
+    return KPIReportBuilder(output_dir=tmp_path)
+
+
+@pytest.fixture
+def north_star_info():
+    """North Star value and components."""
+    return {'value': 162.02, 'components': {'orders_per_customer': 16.23, 'items_per_order': 9.98}}
+
+
+class TestWeeklyBusinessReview:
+    """Test memo sections built from the metrics frame."""
+    
+    def test_urgent_action_names_owner_role(self, builder, north_star_info):
+        """Critical metrics are assigned to their owner role."""
+        metrics = pd.DataFrame({
+            'display_name': ['Reorder Rate'],
+            'value': [0.2],
+            'unit': ['rate'],
+            'status': ['CRITICAL'],
+            'owner_role': ['Lifecycle'],
+        })
+        
+        report = builder.create_weekly_business_review(metrics, north_star_info, save=False)
+        
+        assert "**URGENT:** Address Reorder Rate (20.0%) - assigned to Lifecycle" in report
+    
+    def test_missing_owner_role_defaults(self, builder, north_star_info):
+        """Without owner_role, actions go to the team and the table shows N/A."""
+        metrics = pd.DataFrame({
+            'display_name': ['Reorder Rate'],
+            'value': [0.2],
+            'unit': ['rate'],
+            'status': ['CRITICAL'],
+        })
+        
+        report = builder.create_weekly_business_review(metrics, north_star_info, save=False)
+        
+        assert "assigned to team" in report
+        assert "| Reorder Rate | **20.0%** | N/A | ❌ CRITICAL |" in report
+
+
+class _FixedDatetime(datetime):
+    """datetime with a frozen now(), so two memos can be compared byte for byte."""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 1, 8, 9, 30, 0)
+
+
+class TestGuardrailPartition:
+    """Test pre-split guardrail rows for batch memo generation."""
+    
+    @pytest.fixture
+    def metrics(self):
+        """Metrics of several types, including a guardrail in WARNING."""
+        return pd.DataFrame({
+            'metric_name': ['vpac', 'orders_per_customer', 'reorder_rate', 'median_days_since_prior'],
+            'display_name': ['VPAC', 'Orders per Customer', 'Reorder Rate', 'Median Days Between Orders'],
+            'metric_type': ['north_star', 'driver', 'guardrail', 'guardrail'],
+            'value': [162.02, 16.23, 0.44, 14.8],
+            'unit': ['items/customer', 'orders/customer', 'rate', 'days'],
+            'owner_role': ['Growth', 'Lifecycle', 'Lifecycle', 'Lifecycle'],
+            'status': ['OK', 'OK', 'OK', 'WARNING'],
+        })
+    
+    def test_partition_by_metric_type(self, metrics):
+        """Each metric type maps to its own rows, in input order."""
+        parts = partition_metrics(metrics)
+        
+        assert list(parts) == ['north_star', 'driver', 'guardrail']
+        assert list(parts['guardrail']['metric_name']) == ['reorder_rate', 'median_days_since_prior']
+    
+    def test_pre_split_guardrails_match_scan(self, builder, north_star_info, metrics, monkeypatch):
+        """A memo built with guardrails_df matches one that scans metric_type."""
+        monkeypatch.setattr(memo, 'datetime', _FixedDatetime)
+        
+        scanned = builder.create_weekly_business_review(metrics, north_star_info, save=False)
+        pre_split = builder.create_weekly_business_review(
+            metrics, north_star_info, save=False,
+            guardrails_df=partition_metrics(metrics)['guardrail']
+        )
+        
+        assert pre_split == scanned
+        assert "🟡 **Median Days Between Orders**: 14.8 days - WARNING" in scanned
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -14,6 +14,7 @@ from src.metrics.definitions import (
     compute_orders_per_customer,
     compute_items_per_order,
 )
+from src.metrics.formatting import format_value_series
 
 
 class TestMetricDefinitions:
@@ -53,9 +54,9 @@ class TestMetricDefinitions:
 class TestMetricComputation:
     """Test metric computation functions."""
     
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def sample_user_kpis(self):
-        """Create sample user-level KPI data for testing."""
+        """Create sample user-level KPI data for testing (shared; do not mutate)."""
         return pd.DataFrame({
             'user_id': [1, 2, 3, 4, 5],
             'orders': [10, 5, 2, 1, 15],
@@ -105,5 +106,36 @@ class TestMetricComputation:
         assert abs(vpac - expected_vpac) < 0.01  # Should match within rounding
 
 
+class TestValueFormatting:
+    """Test unit-based display formatting of metric values."""
+    
+    def test_format_by_unit(self):
+        """Test that each unit gets its own format and NaN becomes N/A."""
+        values = pd.Series([0.4437, 206209.0, 16.2267, 14.8, np.nan])
+        units = pd.Series(['rate', 'customers', 'orders/customer', 'days', 'rate'])
+        
+        formatted = format_value_series(values, units)
+        
+        assert list(formatted) == ['44.4%', '206,209', '16.23', '14.8 days', 'N/A']
+    
+    def test_days_without_suffix(self):
+        """Test that days_suffix=False formats days like other plain values."""
+        values = pd.Series([14.8, 0.5])
+        units = pd.Series(['days', 'rate'])
+        
+        formatted = format_value_series(values, units, days_suffix=False)
+        
+        assert list(formatted) == ['14.80', '50.0%']
+    
+    def test_keeps_index(self):
+        """Test that the result aligns with the input index."""
+        values = pd.Series([1200.0, 0.25], index=['orders', 'reorder_rate'])
+        units = pd.Series(['orders', 'rate'], index=['orders', 'reorder_rate'])
+        
+        formatted = format_value_series(values, units)
+        
+        assert formatted.to_dict() == {'orders': '1,200', 'reorder_rate': '25.0%'}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
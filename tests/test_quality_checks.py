@@ -3,6 +3,7 @@ Test quality check system with contracts and reporting.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import sys
@@ -18,6 +19,18 @@ from src.quality.checks import (
 )
 
 
+@pytest.fixture(scope='session')
+def large_user_kpis():
+    """200K-row user_kpis frame above the contract minimum, built once per session."""
+    n = 200_000
+    return pd.DataFrame({
+        'user_id': np.arange(n, dtype=np.int32),
+        'orders': np.full(n, 5, dtype=np.int8),
+        'items': np.full(n, 20, dtype=np.int8),
+        'reorder_rate': np.full(n, 0.5, dtype=np.float32),
+    })
+
+
 class TestDatasetContracts:
     """Test dataset contract validation."""
     
@@ -38,17 +51,10 @@ class TestDatasetContracts:
 class TestQualityChecker:
     """Test quality checker functionality."""
     
-    def test_valid_dataset_passes(self):
+    def test_valid_dataset_passes(self, large_user_kpis):
         """Test that valid dataset passes all checks."""
-        df = pd.DataFrame({
-            'user_id': range(200_000),
-            'orders': [5] * 200_000,
-            'items': [20] * 200_000,
-            'reorder_rate': [0.5] * 200_000,
-        })
-        
         checker = DataQualityChecker()
-        results = checker.validate_dataset(df, 'user_kpis')
+        results = checker.validate_dataset(large_user_kpis, 'user_kpis')
         
         assert len(results) > 0
         assert not checker.has_errors()
@@ -56,7 +62,7 @@ class TestQualityChecker:
     def test_missing_columns_fails(self):
         """Test that missing required columns causes error."""
         df = pd.DataFrame({
-            'user_id': range(1000),
+            'user_id': np.arange(1000, dtype=np.int32),
             # Missing 'orders' column
         })
         
@@ -83,15 +89,148 @@ class TestQualityChecker:
         warnings = [r for r in results if r.severity == CheckSeverity.WARNING and not r.passed]
         assert len(warnings) > 0
     
+    def test_severity_ordering(self):
+        """Test that severities compare by how blocking they are."""
+        assert CheckSeverity.INFO < CheckSeverity.WARNING < CheckSeverity.ERROR
+        assert max(CheckSeverity) == CheckSeverity.ERROR
+
+    def test_zero_null_tolerance(self):
+        """Test that a single NULL fails a zero-tolerance contract."""
+        checker = DataQualityChecker()
+
+        clean = pd.DataFrame({'order_id': [1, 2, 3], 'product_id': [10, 20, 30]})
+        checker.validate_dataset(clean, 'order_products')
+        assert not checker.has_errors()
+
+        dirty = pd.DataFrame({'order_id': [1, 2, None], 'product_id': [10, 20, 30]})
+        results = checker.validate_dataset(dirty, 'order_products')
+        assert checker.has_errors()
+        null_results = [r for r in results if r.check_name == 'null_rate_order_id']
+        assert null_results[0].details['null_rate'] == pytest.approx(1 / 3)
+
+    def test_duplicate_rows_counted(self):
+        """Test that repeated rows are counted once per extra copy."""
+        df = pd.DataFrame({
+            'user_id': [1, 2, 2, 3, 3, 3],
+            'orders': [5, 6, 6, 7, 7, 7],
+            'items': [20, 30, 30, 40, 40, 40],
+            'reorder_rate': [0.5, 0.4, 0.4, 0.3, 0.3, 0.3],
+        })
+
+        checker = DataQualityChecker()
+        results = checker.validate_dataset(df, 'user_kpis')
+
+        dup_results = [r for r in results if r.check_name == 'duplicates']
+        assert len(dup_results) == 1
+        assert dup_results[0].details['duplicate_count'] == 3
+
+    def test_duplicate_rows_follow_value_equality(self):
+        """Test that rows equal by value count as duplicates (0.0 == -0.0)."""
+        df = pd.DataFrame({'reorder_rate': [0.0, -0.0]})
+
+        checker = DataQualityChecker()
+        results = checker.validate_dataset(df, 'scores')
+
+        dup_results = [r for r in results if r.check_name == 'duplicates']
+        assert dup_results[0].details['duplicate_count'] == 1
+
+    def test_dtype_optimization_leaves_input_untouched(self):
+        """Test that compact dtypes are applied to a copy, not the caller's frame."""
+        df = pd.DataFrame({
+            'order_id': range(1000),
+            'user_id': ['u1', 'u2'] * 500,
+            'order_number': [1, 250] * 500,
+        })
+        original_dtypes = df.dtypes.copy()
+
+        checker = DataQualityChecker()
+        compact = checker.optimize_dtypes(df, DATASET_CONTRACTS['orders'])
+        results = checker.validate_dataset(compact, 'orders')
+
+        pd.testing.assert_series_equal(df.dtypes, original_dtypes)
+        assert compact['order_number'].dtype == np.int16
+        assert compact['user_id'].dtype == object
+        range_results = [r for r in results if r.check_name == 'range_order_number']
+        assert range_results[0].details['actual_range'] == (1, 250)
+
+    def test_arrow_backed_matches_numpy(self):
+        """Test that Arrow-backed validation reports the same results."""
+        df = pd.DataFrame({
+            'user_id': [1, 2, 2, 3, 4],
+            'orders': [5, 300, 300, 0, None],
+            'items': [1, 2, 2, 3, 4],
+            'reorder_rate': [0.1, 1.5, 1.5, 0.2, 0.3],
+        })
+
+        def summarize(results):
+            return [(r.check_name, r.passed, r.severity, r.message) for r in results]
+
+        checker = DataQualityChecker()
+        numpy_results = summarize(checker.validate_dataset(df, 'user_kpis'))
+        arrow_results = summarize(checker.validate_dataset(df, 'user_kpis', arrow_backed=True))
+
+        assert arrow_results == numpy_results
+
+    def test_range_follows_runtime_contract_edit(self, monkeypatch):
+        """Test that edits to a default contract's bounds are picked up."""
+        df = pd.DataFrame({
+            'user_id': [1, 2, 3],
+            'orders': [5, 6, 7],
+            'items': [1, 2, 3],
+            'reorder_rate': [0.1, 0.2, 0.3],
+        })
+        checker = DataQualityChecker()
+
+        results = checker.validate_dataset(df, 'user_kpis')
+        assert not [r for r in results if r.check_name == 'range_orders']
+
+        ranges = DATASET_CONTRACTS['user_kpis'].expected_ranges
+        monkeypatch.setitem(ranges, 'orders', (1, 3))
+        results = checker.validate_dataset(df, 'user_kpis')
+        range_results = [r for r in results if r.check_name == 'range_orders']
+        assert range_results[0].details['actual_range'] == (5, 7)
+
+    def test_range_on_ordered_categorical(self):
+        """Test that ordered categorical range columns are still checked."""
+        df = pd.DataFrame({
+            'user_id': [1, 2],
+            'orders': pd.Categorical([5, 600], ordered=True),
+            'items': [1, 2],
+            'reorder_rate': [0.1, 0.2],
+        })
+        checker = DataQualityChecker()
+        results = checker.validate_dataset(df, 'user_kpis')
+
+        range_results = [r for r in results if r.check_name == 'range_orders']
+        assert range_results[0].details['actual_range'] == (5, 600)
+
+    def test_pooled_checks_match_inline(self, monkeypatch):
+        """Test that checks run on the shared pool report the same results."""
+        df = pd.DataFrame({
+            'user_id': [1, 2, 2, 3],
+            'orders': [5, 300, 300, None],
+            'items': [1, 2, 2, 3],
+            'reorder_rate': [0.1, 1.5, 1.5, 0.2],
+        })
+
+        def summarize(results):
+            return [(r.check_name, r.passed, r.severity, r.message) for r in results]
+
+        checker = DataQualityChecker()
+        inline_results = summarize(checker.validate_dataset(df, 'user_kpis'))
+        monkeypatch.setattr('src.quality.checks.PARALLEL_CHECK_MIN_ROWS', 0)
+        pooled_results = summarize(checker.validate_dataset(df, 'user_kpis'))
+
+        assert pooled_results == inline_results
+
     def test_report_generation(self, tmp_path):
         """Test that report generates correctly."""
+        n = 1000
         df = pd.DataFrame({
-            'user_id': range(1000),
-            '
-
-orders': [5] * 1000,
-            'items': [20] * 1000,
-            'reorder_rate': [0.5] * 1000,
+            'user_id': np.arange(n, dtype=np.int32),
+            'orders': np.full(n, 5, dtype=np.int8),
+            'items': np.full(n, 20, dtype=np.int8),
+            'reorder_rate': np.full(n, 0.5, dtype=np.float32),
         })
         
         checker = DataQualityChecker()